@@ -1,11 +1,9 @@
 """CLI entry point for vidio - A simple ffmpeg wrapper."""
 
 import typer
-from rich.console import Console
 
 from vidio_cli import __version__
 from vidio_cli.commands import get_commands
-from vidio_cli.ffmpeg_utils import ensure_ffmpeg
 
 # Create Typer app
 app = typer.Typer(
@@ -14,13 +12,11 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
-
 
 def version_callback(value: bool) -> None:
     """Print the version of the package."""
     if value:
-        console.print(f"[bold]vidio[/bold] version: {__version__}")
+        typer.echo(f"vidio version: {__version__}")
         raise typer.Exit()
 
 
@@ -44,7 +40,14 @@ def main(
     """
     A simple CLI tool to perform common video operations using ffmpeg.
     """
+    # Nothing to check when no subcommand is going to run
+    # (e.g. bare `vidio`, which just shows help)
+    if ctx.invoked_subcommand is None:
+        return
+
     # Check if ffmpeg is installed
+    from vidio_cli.ffmpeg_utils import ensure_ffmpeg
+
     ensure_ffmpeg()
 
     # Store verbose flag in context for global access
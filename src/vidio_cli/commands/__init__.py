@@ -1,36 +1,45 @@
 """Command modules for vidio-cli."""
 
-import pkgutil
+import functools
 from importlib import import_module
-from pathlib import Path
 from typing import Callable
 
+import typer
 
-def get_commands() -> dict[str, Callable]:
+from vidio_cli.commands._manifest import COMMANDS
+
+
+def _lazy_register(module_path: str) -> Callable:
     """
-    Dynamically discover and import all command modules in this package.
+    Build a register function that imports its command module on first call.
+
+    Args:
+        module_path: Dotted path of the command module.
 
     Returns:
-        A dictionary mapping command names to functions.
+        A register function compatible with the per-module `register(app)`.
     """
-    commands = {}
 
-    # Get the directory of this package
-    package_dir = Path(__file__).parent
+    def register(app: typer.Typer) -> None:
+        import_module(module_path).register(app)
+
+    return register
 
-    # Find all Python modules in this package
-    for _, module_name, _ in pkgutil.iter_modules([str(package_dir)]):
-        # Skip the __init__ module
-        if module_name == "__init__":
-            continue
 
-        # Import the module
-        module = import_module(f"{__package__}.{module_name}")
+@functools.cache
+def get_commands() -> dict[str, Callable]:
+    """
+    Collect all command modules in this package.
+
+    The result is memoized, so repeated invocations in one process (e.g.
+    CliRunner-based tests) build the register functions only once.
 
-        # Look for a 'register' function
-        if hasattr(module, "register"):
-            # This is a valid command module, add it to the dict
-            command_name = module_name.replace("_", "-")
-            commands[command_name] = module.register
+    Commands come from the static manifest and are returned as lazy register
+    functions that import their module only when registered — no filesystem
+    scan at startup. New command modules must be added to
+    `commands/_manifest.py`.
 
-    return commands
+    Returns:
+        A dictionary mapping command names to register functions.
+    """
+    return {name: _lazy_register(module_path) for name, module_path in COMMANDS}
@@ -0,0 +1,20 @@
+"""Static manifest of built-in command modules.
+
+Keeping this list in source (instead of scanning the package directory at
+startup) lets `get_commands()` defer importing each command module until it
+is actually registered, which keeps the hot `--help`/`--version` paths from
+paying for every command's imports.
+"""
+
+# (command name, module path) pairs, one per command module.
+COMMANDS: tuple[tuple[str, str], ...] = (
+    ("concat", "vidio_cli.commands.concat"),
+    ("crop", "vidio_cli.commands.crop"),
+    ("grid", "vidio_cli.commands.grid"),
+    ("info", "vidio_cli.commands.info"),
+    ("list", "vidio_cli.commands.list"),
+    ("pipeline", "vidio_cli.commands.pipeline"),
+    ("resize", "vidio_cli.commands.resize"),
+    ("to-gif", "vidio_cli.commands.to_gif"),
+    ("trim", "vidio_cli.commands.trim"),
+)
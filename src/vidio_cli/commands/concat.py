@@ -3,11 +3,6 @@
 from pathlib import Path
 
 import typer
-from rich.console import Console
-
-from vidio_cli.ffmpeg_utils import check_output_file, run_ffmpeg
-
-console = Console()
 
 
 def register(app: typer.Typer) -> None:
@@ -20,6 +15,25 @@ def register(app: typer.Typer) -> None:
     app.command(no_args_is_help=True)(concat)
 
 
+def build_stack_filter(
+    in_labels: list[str], out_label: str, vertical: bool = False
+) -> str:
+    """
+    Build an hstack/vstack filter segment between stream labels.
+
+    Args:
+        in_labels: Input stream labels (without brackets), e.g. ["0:v", "1:v"].
+        out_label: Output stream label (without brackets).
+        vertical: If True, stack vertically instead of horizontally.
+
+    Returns:
+        str: The filter segment, e.g. "[0:v][1:v]hstack=inputs=2[v]".
+    """
+    layout = "vstack" if vertical else "hstack"
+    inputs_str = "".join(f"[{label}]" for label in in_labels)
+    return f"{inputs_str}{layout}=inputs={len(in_labels)}[{out_label}]"
+
+
 def concat(
     ctx: typer.Context,
     input_files: list[Path] = typer.Argument(
@@ -57,28 +71,24 @@ def concat(
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
 
-    # Check if output file exists and if we should overwrite it
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
     if not check_output_file(output_file, overwrite):
-        console.print("[yellow]Aborted.[/yellow]")
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
         raise typer.Exit(code=0)
 
-    # Build the filter complex string for concatenation
-    filter_complex = ""
-
-    # Prepare inputs
-    inputs = []
-    for i, _ in enumerate(input_files):
-        inputs.extend(["-i", str(input_files[i])])
-
-    # Set the layout direction
-    layout = "vstack" if vertical else "hstack"
+    from vidio_cli.ffmpeg_utils import _ffmpeg_thread_count, run_ffmpeg
 
-    # Create filter_complex setting for proper scaling
-    inputs_str = "[0:v]"
-    for i in range(1, len(input_files)):
-        inputs_str += f"[{i}:v]"
+    # Stringify input paths once and reuse them in the -i argument list
+    str_inputs = [str(p) for p in input_files]
+    inputs = [arg for path in str_inputs for arg in ("-i", path)]
 
-    filter_complex = f"{inputs_str}{layout}=inputs={len(input_files)}[v]"
+    # Build the filter complex string for concatenation
+    filter_complex = build_stack_filter(
+        [f"{i}:v" for i in range(len(input_files))], "v", vertical
+    )
 
     # Build the ffmpeg command
     command = [
@@ -94,6 +104,10 @@ def concat(
         # Use the first audio stream for output
         "-c:a",
         "aac",
+        # Budget the filter graph like the encoder threads run_ffmpeg
+        # inserts, so VIDIO_FFMPEG_THREADS caps both
+        "-filter_complex_threads",
+        str(_ffmpeg_thread_count()),
         "-shortest",  # End when shortest input ends
         "-y" if overwrite else "-n",  # Overwrite if specified
         str(output_file),
@@ -4,11 +4,6 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-
-from vidio_cli.ffmpeg_utils import check_output_file, get_video_info, run_ffmpeg
-
-console = Console()
 
 
 def register(app: typer.Typer) -> None:
@@ -60,6 +55,44 @@ def validate_crop_params(
         )
 
 
+# Aspect-ratio presets handled by _crop_to_ratio (center-square/1:1 is special-cased)
+RATIOS = {"16:9": 16 / 9, "9:16": 9 / 16, "4:3": 4 / 3}
+
+
+def _crop_to_ratio(
+    target_ratio: float,
+    original_width: int,
+    original_height: int,
+) -> tuple[int, int, int, int]:
+    """
+    Compute a centered crop of the given aspect ratio.
+
+    Args:
+        target_ratio: Target width/height ratio.
+        original_width: Original video width
+        original_height: Original video height
+
+    Returns:
+        tuple: (width, height, x, y)
+    """
+    current_ratio = original_width / original_height
+
+    if current_ratio > target_ratio:
+        # Too wide, crop width
+        height = original_height
+        width = int(height * target_ratio)
+        x = (original_width - width) // 2
+        y = 0
+    else:
+        # Too tall, crop height
+        width = original_width
+        height = int(width / target_ratio)
+        x = 0
+        y = (original_height - height) // 2
+
+    return width, height, x, y
+
+
 def parse_preset(
     preset: str,
     original_width: int,
@@ -93,65 +126,9 @@ def parse_preset(
         y = (original_height - size) // 2
         return size, size, x, y
 
-    elif preset == "16:9":
-        # Crop to 16:9 aspect ratio
-        target_ratio = 16 / 9
-        current_ratio = original_width / original_height
-
-        if current_ratio > target_ratio:
-            # Too wide, crop width
-            height = original_height
-            width = int(height * target_ratio)
-            x = (original_width - width) // 2
-            y = 0
-        else:
-            # Too tall, crop height
-            width = original_width
-            height = int(width / target_ratio)
-            x = 0
-            y = (original_height - height) // 2
-
-        return width, height, x, y
-
-    elif preset == "9:16":
-        # Crop to 9:16 aspect ratio (vertical/portrait)
-        target_ratio = 9 / 16
-        current_ratio = original_width / original_height
-
-        if current_ratio > target_ratio:
-            # Too wide, crop width
-            height = original_height
-            width = int(height * target_ratio)
-            x = (original_width - width) // 2
-            y = 0
-        else:
-            # Too tall, crop height
-            width = original_width
-            height = int(width / target_ratio)
-            x = 0
-            y = (original_height - height) // 2
-
-        return width, height, x, y
-
-    elif preset == "4:3":
-        # Crop to 4:3 aspect ratio
-        target_ratio = 4 / 3
-        current_ratio = original_width / original_height
-
-        if current_ratio > target_ratio:
-            # Too wide, crop width
-            height = original_height
-            width = int(height * target_ratio)
-            x = (original_width - width) // 2
-            y = 0
-        else:
-            # Too tall, crop height
-            width = original_width
-            height = int(width / target_ratio)
-            x = 0
-            y = (original_height - height) // 2
-
-        return width, height, x, y
+    elif preset in RATIOS:
+        # Crop to the preset aspect ratio, centered
+        return _crop_to_ratio(RATIOS[preset], original_width, original_height)
 
     else:
         raise typer.BadParameter(
@@ -159,6 +136,26 @@ def parse_preset(
         )
 
 
+def build_crop_filter(
+    in_label: str, out_label: str, width: int, height: int, x: int, y: int
+) -> str:
+    """
+    Build a crop filter segment between stream labels.
+
+    Args:
+        in_label: Input stream label (without brackets), e.g. "0:v".
+        out_label: Output stream label (without brackets).
+        width: Crop width.
+        height: Crop height.
+        x: X offset.
+        y: Y offset.
+
+    Returns:
+        str: The filter segment, e.g. "[0:v]crop=320:240:0:0[c0]".
+    """
+    return f"[{in_label}]crop={width}:{height}:{x}:{y}[{out_label}]"
+
+
 def crop(
     ctx: typer.Context,
     input_file: Path = typer.Argument(
@@ -211,6 +208,11 @@ def crop(
         "--keep-aspect/--no-keep-aspect",
         help="Keep aspect ratio when using width/height only",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Trade output size/quality for a much faster encode",
+    ),
     overwrite: bool = typer.Option(
         False,
         "--overwrite",
@@ -232,66 +234,64 @@ def crop(
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
 
-    # Check if output file exists and if we should overwrite it
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
     if not check_output_file(output_file, overwrite):
-        console.print("[yellow]Aborted.[/yellow]")
-        raise typer.Exit(0)
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    from vidio_cli.ffmpeg_utils import (
+        _ffmpeg_thread_count,
+        get_video_dimensions,
+        print_message,
+        run_ffmpeg,
+    )
 
-    # Get original video dimensions
+    # Get original video dimensions via a narrowed probe (only width/height
+    # of the first video stream, not the full format/stream dump)
     try:
-        video_info = get_video_info(input_file, verbose)
-        video_streams = [
-            s for s in video_info.get("streams", []) if s.get("codec_type") == "video"
-        ]
-
-        if not video_streams:
-            console.print("[red]Error: No video stream found in input file[/red]")
-            console.print(
-                "[dim]The file may be corrupted or not a valid video file.[/dim]"
-            )
-            raise typer.Exit(1)
-
-        original_width = video_streams[0].get("width", 0)
-        original_height = video_streams[0].get("height", 0)
+        original_width, original_height = get_video_dimensions(input_file, verbose)
 
         if not original_width or not original_height:
-            console.print(
+            print_message(
                 "[red]Error: Could not determine original video dimensions[/red]"
             )
-            console.print(
+            print_message(
                 "[dim]The video file may be corrupted or in an unsupported format.[/dim]"
             )
             raise typer.Exit(1)
 
         # Validate dimensions are reasonable
         if original_width > 16384 or original_height > 16384:
-            console.print(
+            print_message(
                 f"[yellow]Warning: Very large video dimensions ({original_width}x{original_height}). "
                 "Processing may be slow.[/yellow]"
             )
 
         if original_width < 2 or original_height < 2:
-            console.print(
+            print_message(
                 f"[red]Error: Video dimensions too small ({original_width}x{original_height}). "
                 "Cannot crop.[/red]"
             )
             raise typer.Exit(1)
 
-        console.print(
+        print_message(
             f"[dim]Original video dimensions: {original_width}x{original_height}[/dim]"
         )
 
     except typer.Exit:
         raise
     except Exception as e:
-        console.print(f"[red]Error reading video info: {e}[/red]")
-        console.print("[dim]Make sure the input file is a valid video file.[/dim]")
+        print_message(f"[red]Error reading video info: {e}[/red]")
+        print_message("[dim]Make sure the input file is a valid video file.[/dim]")
         raise typer.Exit(1)
 
     # Determine crop parameters
     if preset:
         if any([width, height, x, y]):
-            console.print(
+            print_message(
                 "[yellow]Warning: Preset specified, ignoring manual crop parameters[/yellow]"
             )
 
@@ -299,28 +299,28 @@ def crop(
             crop_width, crop_height, crop_x, crop_y = parse_preset(
                 preset, original_width, original_height
             )
-            console.print(f"[blue]Using preset: {preset}[/blue]")
+            print_message(f"[blue]Using preset: {preset}[/blue]")
         except typer.BadParameter as e:
-            console.print(f"[red]Error: {e}[/red]")
+            print_message(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
 
     else:
         # Manual crop parameters
         if width is None or height is None:
-            console.print(
+            print_message(
                 "[red]Error: Must specify --width and --height, or use --preset[/red]"
             )
             raise typer.Exit(1)
 
         # Validate manual dimensions don't exceed video
         if width > original_width:
-            console.print(
+            print_message(
                 f"[red]Error: Crop width ({width}) exceeds video width ({original_width})[/red]"
             )
             raise typer.Exit(1)
 
         if height > original_height:
-            console.print(
+            print_message(
                 f"[red]Error: Crop height ({height}) exceeds video height ({original_height})[/red]"
             )
             raise typer.Exit(1)
@@ -334,24 +334,24 @@ def crop(
         if x is None and y is None and keep_aspect:
             crop_x = (original_width - crop_width) // 2
             crop_y = (original_height - crop_height) // 2
-            console.print("[dim]Centering crop region (no offsets specified)[/dim]")
+            print_message("[dim]Centering crop region (no offsets specified)[/dim]")
 
     # Ensure even dimensions for better codec compatibility
     if crop_width % 2 != 0:
         crop_width -= 1
-        console.print(
+        print_message(
             f"[dim]Adjusted width to {crop_width} (must be even for codec compatibility)[/dim]"
         )
 
     if crop_height % 2 != 0:
         crop_height -= 1
-        console.print(
+        print_message(
             f"[dim]Adjusted height to {crop_height} (must be even for codec compatibility)[/dim]"
         )
 
     # Warn if crop dimensions are very small
     if crop_width < 64 or crop_height < 64:
-        console.print(
+        print_message(
             f"[yellow]Warning: Very small crop dimensions ({crop_width}x{crop_height}). "
             "Output quality may be poor.[/yellow]"
         )
@@ -362,11 +362,11 @@ def crop(
             crop_width, crop_height, crop_x, crop_y, original_width, original_height
         )
     except typer.BadParameter as e:
-        console.print(f"[red]Error: {e}[/red]")
+        print_message(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
     # Show what we're doing
-    console.print(
+    print_message(
         f"[blue]Cropping to {crop_width}x{crop_height} at position ({crop_x}, {crop_y})[/blue]"
     )
 
@@ -379,8 +379,14 @@ def crop(
         str(input_file),
         "-vf",
         crop_filter,
+        # Fast mode: explicit ultrafast x264 encode for preview-speed output
+        *(("-c:v", "libx264", "-preset", "ultrafast") if fast else ()),
         "-c:a",
         "copy",  # Copy audio without re-encoding
+        # Budget the filter chain like the encoder threads run_ffmpeg
+        # inserts, so VIDIO_FFMPEG_THREADS caps both
+        "-filter_threads",
+        str(_ffmpeg_thread_count()),
         "-y" if overwrite else "-n",  # Overwrite if specified
         str(output_file),
     ]
@@ -388,4 +394,4 @@ def crop(
     # Run the command
     run_ffmpeg(command, verbose=verbose)
 
-    console.print(f"[green]✓[/green] Cropped video saved to {output_file}")
+    print_message(f"[green]✓[/green] Cropped video saved to {output_file}")
@@ -1,14 +1,20 @@
 """Command module for arranging videos in a grid layout."""
 
+import functools
 import math
+import os
+import tempfile
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
-from vidio_cli.ffmpeg_utils import run_ffmpeg, check_output_file
 
-console = Console()
+# Per-cell scale+pad template, parsed once at module load instead of
+# re-tokenizing an f-string for every cell of a large grid
+_SCALE_PAD_TPL = (
+    "[{i}:v]scale={w}:{h}:force_original_aspect_ratio=decrease,"
+    "pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:{bg}[v{i}];"
+)
 
 
 def register(app: typer.Typer) -> None:
@@ -21,6 +27,7 @@ def register(app: typer.Typer) -> None:
     app.command(no_args_is_help=True)(grid)
 
 
+@functools.cache
 def calculate_grid_size(
     num_videos: int, rows: int | None = None, cols: int | None = None
 ) -> tuple[int, int]:
@@ -114,6 +121,11 @@ def grid(
         "-b",
         help="Background color for empty cells and padding",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Trade output size/quality for a much faster encode",
+    ),
     overwrite: bool = typer.Option(
         False,
         "--overwrite",
@@ -132,27 +144,31 @@ def grid(
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
 
-    # Check if output file exists and if we should overwrite it
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
     if not check_output_file(output_file, overwrite):
-        console.print("[yellow]Aborted.[/yellow]")
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
         raise typer.Exit(code=0)
 
+    from vidio_cli.ffmpeg_utils import _ffmpeg_thread_count, print_message, run_ffmpeg
+
     # Calculate grid dimensions
     try:
         grid_rows, grid_cols = calculate_grid_size(len(input_files), rows, cols)
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        print_message(f"[red]Error:[/red] {str(e)}")
         raise typer.Exit(code=1)
 
     if verbose:
-        console.print(
+        print_message(
             f"Creating {grid_rows}×{grid_cols} video grid with {len(input_files)} videos..."
         )
 
-    # Prepare inputs
-    inputs = []
-    for i, file_path in enumerate(input_files):
-        inputs.extend(["-i", str(file_path)])
+    # Stringify input paths once and reuse them in the -i argument list
+    str_inputs = [str(p) for p in input_files]
+    inputs = [arg for path in str_inputs for arg in ("-i", path)]
 
     # Count of videos to include in the grid
     video_count = min(len(input_files), grid_rows * grid_cols)
@@ -162,47 +178,43 @@ def grid(
         # With specific dimensions: use scale + xstack with fixed positions
 
         # Scale all videos to the same size
-        filter_complex = ""
-        for i in range(video_count):
-            filter_complex += (
-                f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
-                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:{background}[v{i}];"
-            )
-
-        # Calculate positions for each video in the grid
-        positions = []
-        for i in range(video_count):
-            row = i // grid_cols
-            col = i % grid_cols
-            x = col * (width + padding)
-            y = row * (height + padding)
-            positions.append(f"{x}_{y}")
+        parts = [
+            _SCALE_PAD_TPL.format(i=i, w=width, h=height, bg=background)
+            for i in range(video_count)
+        ]
+
+        # Calculate positions for each video in the grid; the per-row and
+        # per-column pixel offsets are precomputed once instead of being
+        # re-multiplied for every cell
+        xs = [col * (width + padding) for col in range(grid_cols)]
+        ys = [row * (height + padding) for row in range(grid_rows)]
+        positions = [
+            f"{xs[i % grid_cols]}_{ys[i // grid_cols]}" for i in range(video_count)
+        ]
 
         # Create inputs string for xstack
-        inputs_str = ""
-        for i in range(video_count):
-            inputs_str += f"[v{i}]"
+        inputs_str = "".join(f"[v{i}]" for i in range(video_count))
 
         # Add xstack filter
-        filter_complex += (
+        parts.append(
             f"{inputs_str}xstack=inputs={video_count}:layout={'|'.join(positions)}"
         )
 
         # Add background color for padding
         if padding > 0:
-            filter_complex += f":fill={background}"
+            parts.append(f":fill={background}")
 
         # Add output label
-        filter_complex += "[v]"
+        parts.append("[v]")
+
+        filter_complex = "".join(parts)
 
     else:
         # Without width/height: use a simplified hstack/vstack approach
-        filter_complex = ""
         default_height = 360  # Use a reasonable default height
 
         # 1. Scale all videos to the same height and label them [v0], [v1], ...
-        for i in range(video_count):
-            filter_complex += f"[{i}:v]scale=-1:{default_height}[v{i}];"
+        parts = [f"[{i}:v]scale=-1:{default_height}[v{i}];" for i in range(video_count)]
 
         row_labels = []  # To store labels like [row0], [row1]
 
@@ -217,42 +229,67 @@ def grid(
             if current_row_input_videos:  # If there are videos in this row
                 row_input_str = "".join(current_row_input_videos)
                 if len(current_row_input_videos) > 1:
-                    filter_complex += f"{row_input_str}hstack=inputs={len(current_row_input_videos)}[row{r}];"
+                    parts.append(
+                        f"{row_input_str}hstack=inputs={len(current_row_input_videos)}[row{r}];"
+                    )
                 else:  # Single video in this row
-                    filter_complex += f"{row_input_str}copy[row{r}];"
+                    parts.append(f"{row_input_str}copy[row{r}];")
                 row_labels.append(f"[row{r}]")
 
         # 3. Stack all created rows vertically (or copy for a single row)
         if row_labels:  # Should always be true if video_count > 0 (min inputs is 2)
             final_rows_input_str = "".join(row_labels)
             if len(row_labels) > 1:
-                filter_complex += (
+                parts.append(
                     f"{final_rows_input_str}vstack=inputs={len(row_labels)}[v];"
                 )
             else:  # Single row overall
-                filter_complex += f"{final_rows_input_str}copy[v];"
+                parts.append(f"{final_rows_input_str}copy[v];")
         # If row_labels is empty (e.g. video_count was 0, though not possible here due to min=2),
         # filter_complex would just contain scaling filters, leading to an error.
         # However, with min=2 inputs, row_labels will always have at least one item.
 
+        filter_complex = "".join(parts)
+
     # Debug output
     if verbose:
-        console.print(f"Filter complex: {filter_complex}")
+        print_message(f"Filter complex: {filter_complex}")
+
+    # Very large graphs are passed through a script file instead of argv,
+    # keeping the command line well under ARG_MAX
+    filter_script = None
+    if len(filter_complex) > 8000:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".filt", delete=False) as tmp:
+            tmp.write(filter_complex)
+            filter_script = tmp.name
 
     # Build the ffmpeg command
     command = [
         "ffmpeg",
         *inputs,
-        "-filter_complex",
-        filter_complex,
+        *(
+            ("-filter_complex_script", filter_script)
+            if filter_script
+            else ("-filter_complex", filter_complex)
+        ),
         "-map",
         "[v]",
         "-c:v",
         "libx264",
+        # Fast mode: ultrafast preset with a lower-quality CRF for previews
+        *(("-preset", "ultrafast", "-crf", "28") if fast else ()),
         "-an",  # No audio
+        # Budget the filter graph like the encoder threads run_ffmpeg
+        # inserts, so VIDIO_FFMPEG_THREADS caps both
+        "-filter_complex_threads",
+        str(_ffmpeg_thread_count()),
         "-y" if overwrite else "-n",
         str(output_file),
     ]
 
     # Run the command
-    run_ffmpeg(command, verbose=verbose)
+    try:
+        run_ffmpeg(command, verbose=verbose)
+    finally:
+        if filter_script:
+            os.unlink(filter_script)
@@ -1,15 +1,8 @@
 """Command module for displaying video file information."""
 
-import json
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from vidio_cli.ffmpeg_utils import ensure_ffprobe, run_command
-
-console = Console()
 
 
 def register(app: typer.Typer) -> None:
@@ -33,7 +26,9 @@ def count_frames(input_file: Path, verbose: bool = False) -> int:
     Returns:
         int: The total number of frames.
     """
-    console.print("Calculating exact frame count (this may take a while)...")
+    from vidio_cli.ffmpeg_utils import print_message, run_command
+
+    print_message("Calculating exact frame count (this may take a while)...")
 
     # Use ffprobe to count frames accurately
     command = [
@@ -77,6 +72,11 @@ def info(
         "--exact-frames",
         help="Calculate exact frame count (slower but accurate)",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached probe results and re-run ffprobe",
+    ),
 ) -> None:
     """
     Display detailed information about a video file.
@@ -88,26 +88,29 @@ def info(
     """
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
+
+    from vidio_cli.ffmpeg_utils import (
+        ensure_ffprobe,
+        get_cached_video_info,
+        get_console,
+    )
+
+    console = get_console()
     ensure_ffprobe()
 
-    # Run ffprobe to get file information
-    command = [
-        "ffprobe",
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_format",
-        "-show_streams",
-        str(input_file),
-    ]
+    # Kick off the slow packet-counting probe in the background before the
+    # metadata probe, so the two ffprobe passes overlap instead of running
+    # back to back; the result is only collected where it is rendered
+    frame_future = None
+    executor = None
+    if exact_frames:
+        from concurrent.futures import ThreadPoolExecutor
 
-    try:
-        result = run_command(command, verbose=verbose, check=True, capture_output=True)
-        info_data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        console.print("[red]Error parsing ffprobe output.[/red]")
-        raise typer.Exit(1)
+        executor = ThreadPoolExecutor(max_workers=1)
+        frame_future = executor.submit(count_frames, input_file, verbose)
+
+    # Probe the file, reusing the on-disk cache for unchanged files
+    info_data = get_cached_video_info(input_file, verbose, refresh=no_cache)
 
     # Extract relevant information
     format_info = info_data.get("format", {})
@@ -129,6 +132,7 @@ def info(
 
     # Calculate total frames if needed
     has_frame_count = False
+    frames_estimated = False
     total_frames = 0
 
     if video_streams:
@@ -138,22 +142,45 @@ def info(
             total_frames = int(video["nb_frames"])
             has_frame_count = True
 
-        # If metadata doesn't have frame count or exact count requested, calculate it
-        if not has_frame_count or exact_frames:
-            total_frames = count_frames(input_file, verbose)
+        if exact_frames:
+            # The slow decode-the-whole-file path the user explicitly opted
+            # into; it has been running concurrently with the metadata probe
+            total_frames = frame_future.result()
             has_frame_count = True
 
             # Update the info_data for JSON output
-            if video_streams:
-                video_streams[0]["nb_frames"] = str(total_frames)
+            video_streams[0]["nb_frames"] = str(total_frames)
+        elif not has_frame_count:
+            # Estimate from duration x fps instead of counting packets, which
+            # reads the entire file; --exact-frames gets the precise number
+            rate_parts = video.get("r_frame_rate", "").split("/")
+            if (
+                len(rate_parts) == 2
+                and rate_parts[0].isdigit()
+                and rate_parts[1].isdigit()
+                and int(rate_parts[1]) != 0
+            ):
+                total_frames = round(
+                    duration_seconds * int(rate_parts[0]) / int(rate_parts[1])
+                )
+                has_frame_count = True
+                frames_estimated = True
+
+    if executor is not None:
+        executor.shutdown()
 
     # Format information nicely
     if json_output:
         # Just output the raw JSON for scripting
-        console.print_json(json.dumps(info_data))
+        from vidio_cli.ffmpeg_utils import json_dumps
+
+        console.print_json(json_dumps(info_data))
         return
 
-    # Create pretty table output
+    # Create pretty table output (rich.table is only imported here, so the
+    # --json scripting path never pays for it)
+    from rich.table import Table
+
     table = Table(title=f"Video Information: {input_file.name}")
 
     # General information
@@ -197,7 +224,8 @@ def info(
 
         # Always show total frames
         if has_frame_count:
-            table.add_row("Total Frames", f"{total_frames:,}")
+            frames_label = "Total Frames (est.)" if frames_estimated else "Total Frames"
+            table.add_row(frames_label, f"{total_frames:,}")
 
         # Pixel format
         table.add_row("Pixel Format", video.get("pix_fmt", "Unknown"))
@@ -1,38 +1,35 @@
 """Command module for listing video files in the current directory."""
 
-import json
-import subprocess
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from vidio_cli.ffmpeg_utils import ensure_ffprobe, run_command
-
-console = Console()
-
-# Common video file extensions
-VIDEO_EXTENSIONS = {
-    ".mp4",
-    ".avi",
-    ".mov",
-    ".mkv",
-    ".wmv",
-    ".flv",
-    ".webm",
-    ".m4v",
-    ".3gp",
-    ".3g2",
-    ".mxf",
-    ".roq",
-    ".nsv",
-    ".f4v",
-    ".f4p",
-    ".f4a",
-    ".f4b",
-}
+
+
+# Common video file extensions (lowercase; matched case-insensitively)
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".mkv",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".m4v",
+        ".3gp",
+        ".3g2",
+        ".mxf",
+        ".roq",
+        ".nsv",
+        ".f4v",
+        ".f4p",
+        ".f4a",
+        ".f4b",
+    }
+)
 
 
 def register(app: typer.Typer) -> None:
@@ -47,39 +44,84 @@ def register(app: typer.Typer) -> None:
     app.command("ls", no_args_is_help=False)(list_videos)
 
 
-def get_video_info(video_file: Path, verbose: bool = False) -> Optional[dict]:
+def _iter_video_files(root: Path, recursive: bool):
+    """
+    Yield os.DirEntry objects for video files under a directory.
+
+    A single os.scandir walk replaces one glob per extension (and per case
+    variant), so the tree is traversed once and each entry is stat'd once.
+
+    Args:
+        root: Directory to scan.
+        recursive: If True, descend into subdirectories.
     """
-    Get basic information about a video file using ffprobe.
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                        yield entry
+        except OSError:
+            # Unreadable directory - skip it, like glob would
+            continue
+
+
+def _fast_probe_all(video_files: list[Path]) -> dict:
+    """
+    Probe container headers in-process with PyAV, if it is installed.
+
+    Opening the container reads only its header - no subprocess spawn and
+    no stream decode - which is all the listing needs (duration, codec,
+    dimensions). Files PyAV cannot read are left out of the result so the
+    caller can fall back to ffprobe for them.
 
     Args:
-        video_file: Path to the video file.
-        verbose: If True, show ffprobe commands and other debug info.
+        video_files: Paths to probe.
 
     Returns:
-        dict: Video information or None if failed to get info.
+        dict: Mapping of path to an ffprobe-shaped info dict, containing
+        only the files PyAV could open.
     """
-    command = [
-        "ffprobe",
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_format",
-        "-show_streams",
-        str(video_file),
-    ]
-
     try:
-        result = run_command(command, verbose=verbose, check=True, capture_output=True)
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, subprocess.CalledProcessError, FileNotFoundError):
-        return None
+        import av
+    except ImportError:
+        return {}
+
+    results = {}
+    for path in video_files:
+        try:
+            with av.open(str(path), metadata_errors="ignore") as container:
+                info: dict = {"format": {}, "streams": []}
+                if container.duration is not None:
+                    info["format"]["duration"] = str(container.duration / av.time_base)
+                for stream in container.streams.video:
+                    codec = stream.codec_context
+                    info["streams"].append(
+                        {
+                            "codec_type": "video",
+                            "codec_name": codec.name,
+                            "width": codec.width,
+                            "height": codec.height,
+                        }
+                    )
+                results[path] = info
+        except (av.error.FFmpegError, OSError, ValueError):
+            continue
+    return results
 
 
+@functools.lru_cache(maxsize=2048)
 def format_duration(seconds: float) -> str:
     """
     Format duration from seconds to HH:MM:SS format.
 
+    Results are memoized; directories full of clips with identical
+    durations or sizes format each distinct value once.
+
     Args:
         seconds: Duration in seconds.
 
@@ -94,6 +136,7 @@ def format_duration(seconds: float) -> str:
     return f"{int(hours):02d}:{int(minutes):02d}:{int(secs):02d}"
 
 
+@functools.lru_cache(maxsize=2048)
 def format_size(bytes_size: int) -> str:
     """
     Format file size in human-readable format.
@@ -114,30 +157,45 @@ def format_size(bytes_size: int) -> str:
 def format_ls_output(video_data: list[dict], verbose: bool = False) -> None:
     """
     Format video data in ls -l style output with colors.
-    
+
     Args:
         video_data: List of video file information dictionaries.
         verbose: If True, show detailed information.
     """
     if not video_data:
         return
-    
+
+    from vidio_cli.ffmpeg_utils import print_message
+
     # Calculate column widths for alignment
     max_size_width = max(len(video["size_formatted"]) for video in video_data)
-    max_duration_width = max(len(video.get("duration_formatted", "")) for video in video_data) if verbose else 0
-    max_resolution_width = max(len(video.get("resolution", "")) for video in video_data) if verbose else 0
-    
+    max_duration_width = (
+        max(len(video.get("duration_formatted", "")) for video in video_data)
+        if verbose
+        else 0
+    )
+    max_resolution_width = (
+        max(len(video.get("resolution", "")) for video in video_data) if verbose else 0
+    )
+
+    # Accumulate all rows and emit them in one write instead of going
+    # through the print pipeline once per file
+    lines = []
     for video in video_data:
         # File size (right-aligned like ls -l)
         size_str = f"{video['size_formatted']:>{max_size_width}}"
-        
+
         if verbose:
             # Detailed format: size duration resolution codec filename
-            duration_str = f"{video.get('duration_formatted', 'Unknown'):<{max_duration_width}}"
-            resolution_str = f"{video.get('resolution', 'Unknown'):<{max_resolution_width}}"
-            codec_str = video.get('codec', 'Unknown')
-            
-            console.print(
+            duration_str = (
+                f"{video.get('duration_formatted', 'Unknown'):<{max_duration_width}}"
+            )
+            resolution_str = (
+                f"{video.get('resolution', 'Unknown'):<{max_resolution_width}}"
+            )
+            codec_str = video.get("codec", "Unknown")
+
+            lines.append(
                 f"[green]{size_str}[/green] "
                 f"[yellow]{duration_str}[/yellow] "
                 f"[magenta]{resolution_str}[/magenta] "
@@ -146,9 +204,9 @@ def format_ls_output(video_data: list[dict], verbose: bool = False) -> None:
             )
         else:
             # Simple format: size filename (like ls -l)
-            console.print(
-                f"[green]{size_str}[/green] [cyan]{video['name']}[/cyan]"
-            )
+            lines.append(f"[green]{size_str}[/green] [cyan]{video['name']}[/cyan]")
+
+    print_message("\n".join(lines))
 
 
 def list_videos(
@@ -184,11 +242,17 @@ def list_videos(
         "-t",
         help="Use table format instead of ls-style output",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached probe results and re-run ffprobe",
+    ),
 ) -> None:
     """
     List all video files in the specified directory (or current directory).
-    
-    By default, shows files in ls-style format with colors. Use --table for table format.
+
+    By default, shows files in ls-style format with colors; this basic listing
+    reads no video metadata, so it is instant. Use --table for table format.
 
     Examples:
         - List videos in current directory: vidio list (or vidio ls)
@@ -200,50 +264,58 @@ def list_videos(
     """
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
+
+    from vidio_cli.ffmpeg_utils import ensure_ffprobe, get_console, print_message
+
+    console = get_console()
     ensure_ffprobe()
 
     # Use current directory if none specified
     target_dir = directory or Path.cwd()
 
-    # Find video files
-    video_files = []
-
-    if recursive:
-        # Search recursively
-        for ext in VIDEO_EXTENSIONS:
-            video_files.extend(target_dir.rglob(f"*{ext}"))
-            video_files.extend(target_dir.rglob(f"*{ext.upper()}"))
-    else:
-        # Search only in the specified directory
-        for ext in VIDEO_EXTENSIONS:
-            video_files.extend(target_dir.glob(f"*{ext}"))
-            video_files.extend(target_dir.glob(f"*{ext.upper()}"))
-
-    # Remove duplicates and sort
-    video_files = sorted(set(video_files))
+    # Find video files in a single directory walk (extensions are matched
+    # case-insensitively against the lowercase VIDEO_EXTENSIONS set)
+    entries = sorted(_iter_video_files(target_dir, recursive), key=lambda e: e.path)
+    video_files = [Path(entry.path) for entry in entries]
 
     if not video_files:
         search_location = "recursively" if recursive else "in directory"
-        console.print(
+        print_message(
             f"[yellow]No video files found {search_location}: {target_dir}[/yellow]"
         )
         return
 
+    # Probe all files in one batch when details are needed; batch_probe
+    # overlaps the ffprobe subprocesses and serves unchanged files from
+    # the on-disk cache. The basic listing only shows size and name, both
+    # of which come from stat(), so it never probes at all.
+    need_probe = detailed or json_output
+    probe_results: dict[Path, Optional[dict]] = {}
+    if need_probe:
+        # Prefer in-process header reads (PyAV, when installed) and only
+        # spawn ffprobe for the files PyAV could not open
+        probe_results = _fast_probe_all(video_files)
+        remaining = [f for f in video_files if f not in probe_results]
+        if remaining:
+            from vidio_cli.ffmpeg_utils import batch_probe
+
+            probe_results.update(batch_probe(remaining, verbose, refresh=no_cache))
+
     # Prepare data for output
     video_data = []
 
-    for video_file in video_files:
-        file_stat = video_file.stat()
+    for entry, video_file in zip(entries, video_files):
+        file_stat = entry.stat()
         file_info = {
-            "name": video_file.name,
-            "path": str(video_file),
+            "name": entry.name,
+            "path": entry.path,
             "size_bytes": file_stat.st_size,
             "size_formatted": format_size(file_stat.st_size),
         }
 
         # Get detailed info if requested or for default ls-style output
-        if detailed or json_output or not table_format:
-            video_info = get_video_info(video_file, verbose)
+        if need_probe:
+            video_info = probe_results.get(video_file)
             if video_info:
                 format_info = video_info.get("format", {})
                 duration = float(format_info.get("duration", 0))
@@ -279,11 +351,15 @@ def list_videos(
 
     # Output results
     if json_output:
-        console.print_json(json.dumps(video_data, indent=2))
+        from vidio_cli.ffmpeg_utils import json_dumps
+
+        console.print_json(json_dumps(video_data, indent=True))
         return
 
     # Use table format if explicitly requested
     if table_format:
+        from rich.table import Table
+
         if detailed:
             table = Table(title=f"Video Files in {target_dir}")
             table.add_column("Name", style="cyan")
@@ -313,4 +389,4 @@ def list_videos(
         # Default ls-style output
         format_ls_output(video_data, verbose=detailed)
 
-    console.print(f"\n[bold]Found {len(video_files)} video file(s)[/bold]")
+    print_message(f"\n[bold]Found {len(video_files)} video file(s)[/bold]")
@@ -0,0 +1,156 @@
+"""Command module for fused crop + stack pipelines."""
+
+from pathlib import Path
+
+import typer
+
+
+def register(app: typer.Typer) -> None:
+    """
+    Register the pipeline command with the Typer app.
+
+    Args:
+        app: The Typer app to register the command with.
+    """
+    app.command(no_args_is_help=True)(pipeline)
+
+
+def build_pipeline_filter(
+    num_inputs: int, width: int, height: int, x: int, y: int, vertical: bool = False
+) -> str:
+    """
+    Build a fused crop + stack filter graph for the given inputs.
+
+    Args:
+        num_inputs: Number of input videos.
+        width: Crop width.
+        height: Crop height.
+        x: X offset.
+        y: Y offset.
+        vertical: If True, stack vertically instead of horizontally.
+
+    Returns:
+        str: The complete filter_complex string, e.g.
+        "[0:v]crop=320:240:0:0[c0];[1:v]crop=320:240:0:0[c1];[c0][c1]hstack=inputs=2[v]".
+    """
+    from vidio_cli.commands.concat import build_stack_filter
+    from vidio_cli.commands.crop import build_crop_filter
+
+    crops = [
+        build_crop_filter(f"{i}:v", f"c{i}", width, height, x, y)
+        for i in range(num_inputs)
+    ]
+    stack = build_stack_filter([f"c{i}" for i in range(num_inputs)], "v", vertical)
+    return ";".join([*crops, stack])
+
+
+def pipeline(
+    ctx: typer.Context,
+    input_files: list[Path] = typer.Argument(
+        ...,
+        help="Input video files to crop and stack",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+        min=2,
+    ),
+    output_file: Path = typer.Argument(
+        ...,
+        help="Output video file",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    width: int = typer.Option(
+        ...,
+        "--width",
+        "-w",
+        help="Width of the cropped region in pixels",
+        min=1,
+    ),
+    height: int = typer.Option(
+        ...,
+        "--height",
+        "-h",
+        help="Height of the cropped region in pixels",
+        min=1,
+    ),
+    x: int = typer.Option(
+        0,
+        "--x",
+        help="X offset (left edge) of the crop region in pixels",
+        min=0,
+    ),
+    y: int = typer.Option(
+        0,
+        "--y",
+        help="Y offset (top edge) of the crop region in pixels",
+        min=0,
+    ),
+    vertical: bool = typer.Option(
+        False,
+        "--vertical",
+        help="Stack videos vertically instead of horizontally",
+    ),
+    overwrite: bool = typer.Option(
+        False,
+        "--overwrite",
+        help="Overwrite output file if it exists",
+    ),
+) -> None:
+    """
+    Crop multiple videos and stack them in a single ffmpeg pass.
+
+    Running crop and concat separately decodes and encodes the video bytes
+    twice; this fuses both stages into one filter graph, so each input is
+    decoded once and the output is encoded once.
+
+    Examples:
+        - Crop and stack side by side: vidio pipeline a.mp4 b.mp4 out.mp4 -w 640 -h 360
+        - Crop and stack vertically: vidio pipeline a.mp4 b.mp4 out.mp4 -w 640 -h 360 --vertical
+    """
+    # Get verbose flag from global context
+    verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
+
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
+    if not check_output_file(output_file, overwrite):
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    from vidio_cli.ffmpeg_utils import _ffmpeg_thread_count, print_message, run_ffmpeg
+
+    # Stringify input paths once and reuse them in the -i argument list
+    str_inputs = [str(p) for p in input_files]
+    inputs = [arg for path in str_inputs for arg in ("-i", path)]
+
+    # Build the fused filter graph: crop each input, then stack the results
+    filter_complex = build_pipeline_filter(
+        len(input_files), width, height, x, y, vertical
+    )
+
+    if verbose:
+        print_message(f"Filter complex: {filter_complex}")
+
+    # Build the ffmpeg command
+    command = [
+        "ffmpeg",
+        *inputs,
+        "-filter_complex",
+        filter_complex,
+        "-map",
+        "[v]",
+        "-an",  # No audio
+        # Budget the filter graph like the encoder threads run_ffmpeg
+        # inserts, so VIDIO_FFMPEG_THREADS caps both
+        "-filter_complex_threads",
+        str(_ffmpeg_thread_count()),
+        "-y" if overwrite else "-n",  # Overwrite if specified
+        str(output_file),
+    ]
+
+    # Run the command
+    run_ffmpeg(command, verbose=verbose)
+
+    print_message(f"[green]✓[/green] Pipelined video saved to {output_file}")
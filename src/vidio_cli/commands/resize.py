@@ -4,11 +4,6 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-
-from vidio_cli.ffmpeg_utils import check_output_file, get_video_info, run_ffmpeg
-
-console = Console()
 
 
 def register(app: typer.Typer) -> None:
@@ -21,65 +16,64 @@ def register(app: typer.Typer) -> None:
     app.command(no_args_is_help=True)(resize)
 
 
-def validate_dimensions(width: Optional[int], height: Optional[int], scale: Optional[float]) -> None:
+def validate_dimensions(
+    width: Optional[int], height: Optional[int], scale: Optional[float]
+) -> None:
     """
     Validate resize parameters.
-    
+
     Args:
         width: Target width in pixels
-        height: Target height in pixels  
+        height: Target height in pixels
         scale: Scale factor
-        
+
     Raises:
         typer.BadParameter: If parameters are invalid
     """
     if not any([width, height, scale]):
-        raise typer.BadParameter("Must specify at least one of: --width, --height, or --scale")
-    
+        raise typer.BadParameter(
+            "Must specify at least one of: --width, --height, or --scale"
+        )
+
     if scale and (width or height):
         raise typer.BadParameter("Cannot use --scale with --width or --height")
-    
+
     if scale and (scale <= 0 or scale > 10):
         raise typer.BadParameter("Scale must be between 0 and 10")
-    
+
     if width and width <= 0:
         raise typer.BadParameter("Width must be positive")
-        
+
     if height and height <= 0:
         raise typer.BadParameter("Height must be positive")
 
 
 def build_scale_filter(
-    width: Optional[int], 
-    height: Optional[int], 
+    width: Optional[int],
+    height: Optional[int],
     scale: Optional[float],
     maintain_aspect: bool,
-    original_width: int,
-    original_height: int
 ) -> str:
     """
     Build the ffmpeg scale filter string.
-    
+
+    The aspect-ratio arithmetic is expressed with ffmpeg's own iw/ih
+    variables, so the original dimensions never need to be probed.
+
     Args:
         width: Target width
         height: Target height
         scale: Scale factor
         maintain_aspect: Whether to maintain aspect ratio
-        original_width: Original video width
-        original_height: Original video height
-        
+
     Returns:
         str: ffmpeg scale filter string
     """
     if scale:
-        # Scale both dimensions by the same factor
-        new_width = int(original_width * scale)
-        new_height = int(original_height * scale)
-        # Ensure even dimensions for better codec compatibility
-        new_width = new_width - (new_width % 2)
-        new_height = new_height - (new_height % 2)
-        return f"scale={new_width}:{new_height}"
-    
+        # Scale both dimensions by the same factor; trunc(.../2)*2 keeps
+        # the result even for codec compatibility
+        return f"scale=trunc(iw*{scale}/2)*2:trunc(ih*{scale}/2)*2"
+
     if maintain_aspect:
         # Use -2 to maintain aspect ratio and ensure even dimensions
         if width and height:
@@ -89,14 +83,89 @@ def build_scale_filter(
         elif height:
             return f"scale=-2:{height}"
     else:
-        # Force exact dimensions (may distort)
-        w = width or original_width
-        h = height or original_height
+        # Force exact dimensions (may distort); missing ones keep the source size
+        w = width if width else "iw"
+        h = height if height else "ih"
         return f"scale={w}:{h}"
-    
+
     return "scale=-2:-2"  # Fallback
 
 
+# GPU scale filters and encoders per hwaccel backend
+_HW_SCALE_FILTERS = {"cuda": "scale_cuda", "qsv": "scale_qsv", "vaapi": "scale_vaapi"}
+_HW_ENCODERS = {"cuda": "h264_nvenc", "qsv": "h264_qsv", "vaapi": "h264_vaapi"}
+_HWACCEL_CHOICES = ("auto", "cuda", "qsv", "vaapi", "none")
+
+
+def build_scale_filter_hw(
+    backend: str,
+    width: Optional[int],
+    height: Optional[int],
+    scale: Optional[float],
+    maintain_aspect: bool,
+) -> str:
+    """
+    Build a hardware scale filter string for the given backend.
+
+    Mirrors build_scale_filter but uses the backend's GPU scaler
+    (scale_cuda, scale_qsv or scale_vaapi) so frames stay in GPU memory.
+
+    Args:
+        backend: Hwaccel backend name ("cuda", "qsv" or "vaapi").
+        width: Target width
+        height: Target height
+        scale: Scale factor
+        maintain_aspect: Whether to maintain aspect ratio
+
+    Returns:
+        str: ffmpeg scale filter string
+    """
+    # The GPU scalers accept the same iw/ih expressions as swscale, so the
+    # CPU filter can be rewritten by swapping the filter name
+    cpu_filter = build_scale_filter(width, height, scale, maintain_aspect)
+    return cpu_filter.replace("scale=", f"{_HW_SCALE_FILTERS[backend]}=", 1)
+
+
+def _resolve_hwaccel(choice: str, verbose: bool = False) -> Optional[str]:
+    """
+    Resolve the --hwaccel option to a usable backend, or None for CPU.
+
+    "auto" picks the first supported backend reported by ffmpeg; an
+    explicit backend that ffmpeg does not support falls back to the CPU
+    path with a warning rather than failing the encode.
+
+    Args:
+        choice: The --hwaccel option value.
+        verbose: If True, report which backend was selected.
+
+    Returns:
+        Optional[str]: Backend name, or None for the software path.
+    """
+    from vidio_cli.ffmpeg_utils import detect_hwaccels, print_message
+
+    if choice == "none":
+        return None
+
+    available = detect_hwaccels()
+
+    if choice == "auto":
+        for backend in ("cuda", "qsv", "vaapi"):
+            if backend in available:
+                if verbose:
+                    print_message(f"[dim]Using hardware acceleration: {backend}[/dim]")
+                return backend
+        return None
+
+    if choice not in available:
+        print_message(
+            f"[yellow]Warning: ffmpeg does not support hwaccel '{choice}', "
+            "falling back to software encoding[/yellow]"
+        )
+        return None
+
+    return choice
+
+
 def resize(
     ctx: typer.Context,
     input_file: Path = typer.Argument(
@@ -123,7 +192,7 @@ def resize(
         None,
         "--height",
         "-h",
-        help="Target height in pixels", 
+        help="Target height in pixels",
         min=1,
     ),
     scale: Optional[float] = typer.Option(
@@ -139,6 +208,11 @@ def resize(
         "--force-aspect",
         help="Force exact dimensions (may distort image)",
     ),
+    hwaccel: str = typer.Option(
+        "none",
+        "--hwaccel",
+        help="Hardware acceleration backend (auto, cuda, qsv, vaapi, none)",
+    ),
     overwrite: bool = typer.Option(
         False,
         "--overwrite",
@@ -159,62 +233,90 @@ def resize(
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
 
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
+    if not check_output_file(output_file, overwrite):
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    from vidio_cli.ffmpeg_utils import print_message, run_ffmpeg
+
     # Validate parameters
     validate_dimensions(width, height, scale)
 
-    # Check if output file exists and if we should overwrite it
-    if not check_output_file(output_file, overwrite):
-        console.print("[yellow]Aborted.[/yellow]")
-        raise typer.Exit(0)
-
-    # Get original video dimensions
-    try:
-        video_info = get_video_info(input_file, verbose)
-        video_streams = [s for s in video_info.get("streams", []) if s.get("codec_type") == "video"]
-        
-        if not video_streams:
-            console.print("[red]Error: No video stream found in input file[/red]")
-            raise typer.Exit(1)
-            
-        original_width = video_streams[0].get("width", 0)
-        original_height = video_streams[0].get("height", 0)
-        
-        if not original_width or not original_height:
-            console.print("[red]Error: Could not determine original video dimensions[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error reading video info: {e}[/red]")
-        raise typer.Exit(1)
-
-    # Build the scale filter
+    if hwaccel not in _HWACCEL_CHOICES:
+        raise typer.BadParameter(
+            f"Invalid --hwaccel value: {hwaccel}. Valid choices: {', '.join(_HWACCEL_CHOICES)}"
+        )
+
+    # Pick a GPU backend (if requested and available) before building the
+    # filter, since the hardware scalers have their own filter names
+    backend = _resolve_hwaccel(hwaccel, verbose)
+
+    # Build the scale filter; all aspect math happens inside ffmpeg, so no
+    # ffprobe pass over the input is needed
     maintain_aspect = not force_aspect
-    scale_filter = build_scale_filter(
-        width, height, scale, maintain_aspect, original_width, original_height
-    )
+    if backend:
+        scale_filter = build_scale_filter_hw(
+            backend, width, height, scale, maintain_aspect
+        )
+    else:
+        scale_filter = build_scale_filter(width, height, scale, maintain_aspect)
 
     # Show what we're doing
     if scale:
-        console.print(f"[blue]Scaling video by {scale}x[/blue]")
+        print_message(f"[blue]Scaling video by {scale}x[/blue]")
     else:
         target_w = width or "auto"
         target_h = height or "auto"
-        console.print(f"[blue]Resizing video to {target_w}x{target_h}[/blue]")
-        
+        print_message(f"[blue]Resizing video to {target_w}x{target_h}[/blue]")
+
     if not maintain_aspect:
-        console.print("[yellow]Warning: Forcing aspect ratio may distort the video[/yellow]")
+        print_message(
+            "[yellow]Warning: Forcing aspect ratio may distort the video[/yellow]"
+        )
 
-    # Build the ffmpeg command
+    # Build the ffmpeg command; with a GPU backend, decode, scale and
+    # encode all happen on the device (frames never round-trip to system
+    # memory thanks to -hwaccel_output_format)
     command = [
         "ffmpeg",
-        "-i", str(input_file),
-        "-vf", scale_filter,
-        "-c:a", "copy",  # Copy audio without re-encoding
+        *(("-hwaccel", backend, "-hwaccel_output_format", backend) if backend else ()),
+        "-i",
+        str(input_file),
+        "-vf",
+        scale_filter,
+        *(("-c:v", _HW_ENCODERS[backend]) if backend else ()),
+        "-c:a",
+        "copy",  # Copy audio without re-encoding
         "-y" if overwrite else "-n",  # Overwrite if specified
         str(output_file),
     ]
 
-    # Run the command
-    run_ffmpeg(command, verbose=verbose)
+    # Run the command. -hwaccels only reports compiled-in backends, not
+    # working devices, so the hardware attempt is non-fatal: if it exits
+    # non-zero (no GPU, driver mismatch, ...) rerun on the software path
+    result = run_ffmpeg(command, verbose=verbose, check=backend is None)
+    if backend and result.returncode != 0:
+        print_message(
+            f"[yellow]Warning: hardware acceleration '{backend}' failed, "
+            "retrying with software encoding[/yellow]"
+        )
+        command = [
+            "ffmpeg",
+            "-i",
+            str(input_file),
+            "-vf",
+            build_scale_filter(width, height, scale, maintain_aspect),
+            "-c:a",
+            "copy",
+            # check_output_file already sanctioned the write, and the failed
+            # hardware attempt may have left a partial output behind
+            "-y",
+            str(output_file),
+        ]
+        run_ffmpeg(command, verbose=verbose)
 
-    console.print(f"[green]✓[/green] Resized video saved to {output_file}")
\ No newline at end of file
+    print_message(f"[green]✓[/green] Resized video saved to {output_file}")
@@ -1,16 +1,11 @@
 """Command module for converting videos to GIF format."""
 
-import tempfile
+import os
 from pathlib import Path
 from typing import Optional
 
 import click
 import typer
-from rich.console import Console
-
-from vidio_cli.ffmpeg_utils import check_output_file, get_video_info, run_ffmpeg
-
-console = Console()
 
 
 def register(app: typer.Typer) -> None:
@@ -23,42 +18,31 @@ def register(app: typer.Typer) -> None:
     app.command("to-gif", no_args_is_help=True)(to_gif)
 
 
-def parse_time(time_str: str) -> str:
-    """
-    Parse and validate time format.
-    
-    Args:
-        time_str: Time string in format like "00:01:30", "90", "1:30"
-        
-    Returns:
-        str: Validated time string for ffmpeg
-    """
-    # If it's just numbers, assume seconds
-    if time_str.isdigit():
-        return time_str
-    
-    # Basic validation for HH:MM:SS or MM:SS format
-    parts = time_str.split(":")
-    if len(parts) > 3:
-        raise typer.BadParameter("Time format should be HH:MM:SS, MM:SS, or seconds")
-    
-    return time_str
+def _parse_time(value: str) -> str:
+    """Validate a time option, deferring the ffmpeg_utils import to parse time."""
+    from vidio_cli.ffmpeg_utils import parse_time
+
+    return parse_time(value)
+
+
+# Palette size per quality level; --max-colors overrides the mapping
+_QUALITY_COLORS = {"low": 128, "medium": 192, "high": 256}
 
 
 def validate_quality(quality: str) -> str:
     """
     Validate and normalize quality setting.
-    
+
     Args:
         quality: Quality string (low/medium/high or 1-10)
-        
+
     Returns:
         str: Normalized quality level
     """
     quality_lower = quality.lower()
     if quality_lower in ["low", "medium", "high"]:
         return quality_lower
-    
+
     # Try to parse as number
     try:
         q_num = int(quality)
@@ -72,7 +56,9 @@ def validate_quality(quality: str) -> str:
         else:
             raise typer.BadParameter("Quality number must be between 1-10")
     except ValueError:
-        raise typer.BadParameter("Quality must be 'low', 'medium', 'high', or a number 1-10")
+        raise typer.BadParameter(
+            "Quality must be 'low', 'medium', 'high', or a number 1-10"
+        )
 
 
 def build_filter_complex(
@@ -82,17 +68,19 @@ def build_filter_complex(
     start: Optional[str],
     end: Optional[str],
     duration: Optional[str],
-    original_width: int,
-    original_height: int,
+    mpdecimate: bool = False,
 ) -> tuple[list[str], str]:
     """
     Build ffmpeg filter complex and input arguments for GIF conversion.
-    
+
+    The size arithmetic is expressed with ffmpeg's iw/ih variables, so the
+    original dimensions never need to be probed.
+
     Returns:
         tuple: (input_args, filter_string)
     """
     input_args = []
-    
+
     # Add time range options to input
     if start and start != "0":
         input_args.extend(["-ss", start])
@@ -100,39 +88,136 @@ def build_filter_complex(
         input_args.extend(["-to", end])
     elif duration:
         input_args.extend(["-t", duration])
-    
-    # Build scale filter
+
+    # Dropping near-duplicate frames must happen before the fps resample,
+    # so the decimated timeline is what gets sampled
+    prefix = "mpdecimate," if mpdecimate else ""
+
+    # Build scale filter; trunc(.../2)*2 keeps the dimensions even, and at
+    # original size no scale filter is needed at all
     if scale:
-        new_width = int(original_width * scale)
-        new_height = int(original_height * scale)
-        # Ensure even dimensions
-        new_width = new_width - (new_width % 2)
-        new_height = new_height - (new_height % 2)
-        scale_filter = f"scale={new_width}:{new_height}:flags=lanczos"
+        scale_filter = (
+            f"scale=trunc(iw*{scale}/2)*2:trunc(ih*{scale}/2)*2:flags=lanczos"
+        )
     elif width:
         scale_filter = f"scale={width}:-2:flags=lanczos"
     else:
-        scale_filter = f"scale={original_width}:{original_height}:flags=lanczos"
-    
+        return input_args, f"{prefix}fps={fps}"
+
     # Combine filters
-    filter_string = f"fps={fps},{scale_filter}"
-    
+    filter_string = f"{prefix}fps={fps},{scale_filter}"
+
     return input_args, filter_string
 
 
+def _build_gif_command(
+    input_file: Path,
+    output_file: Path,
+    input_args: list[str],
+    base_filter: str,
+    max_colors: int,
+    dither: str,
+    palette_mode: str,
+    loop: int,
+    no_optimize: bool,
+    overwrite: bool,
+    palette: Optional[Path] = None,
+) -> list[str]:
+    """
+    Assemble the full ffmpeg command for one GIF conversion.
+
+    Returns:
+        list[str]: The ffmpeg argument list.
+    """
+    if palette is not None and not no_optimize:
+        # Reuse a pre-generated palette: skip palettegen entirely and map
+        # the PNG in as a second input for paletteuse
+        return [
+            "ffmpeg",
+            *input_args,
+            "-i",
+            str(input_file),
+            "-i",
+            str(palette),
+            "-filter_complex",
+            f"[0:v]{base_filter}[x];[x][1:v]paletteuse=dither={dither}",
+            "-loop",
+            str(loop),
+            # Let the scale/palette graph use the otherwise-idle cores
+            "-filter_complex_threads",
+            str(os.cpu_count() or 4),
+            "-y" if overwrite else "-n",
+            str(output_file),
+        ]
+
+    if no_optimize:
+        # Single-pass conversion without palette optimization
+        return [
+            "ffmpeg",
+            *input_args,
+            "-i",
+            str(input_file),
+            "-vf",
+            base_filter,
+            "-loop",
+            str(loop),
+            # Let the fps/scale chain use the otherwise-idle cores
+            "-filter_threads",
+            str(os.cpu_count() or 4),
+            "-y" if overwrite else "-n",
+            str(output_file),
+        ]
+
+    # Palette mode: "global" builds one palette for the whole clip, while
+    # "diff" and "single" adapt it per changed frame (palettegen stats_mode
+    # plus paletteuse new=1), avoiding banding across scene changes at no
+    # extra decode cost
+    if palette_mode == "global":
+        palettegen_opts = f"palettegen=max_colors={max_colors}:reserve_transparent=0"
+        paletteuse_opts = f"paletteuse=dither={dither}"
+    else:
+        palettegen_opts = (
+            f"palettegen=stats_mode={'diff' if palette_mode == 'diff' else 'single'}"
+            f":max_colors={max_colors}:reserve_transparent=0"
+        )
+        paletteuse_opts = f"paletteuse=dither={dither}:new=1"
+
+    # Single ffmpeg pass: split the decoded frames, feed one branch to
+    # palettegen and pipe the palette straight into paletteuse, so the
+    # input is decoded once and no temporary palette file is written
+    filter_complex = (
+        f"{base_filter},split[a][b];[a]{palettegen_opts}[p];[b][p]{paletteuse_opts}"
+    )
+
+    return [
+        "ffmpeg",
+        *input_args,
+        "-i",
+        str(input_file),
+        "-filter_complex",
+        filter_complex,
+        "-loop",
+        str(loop),
+        # Let the scale/palette graph use the otherwise-idle cores
+        "-filter_complex_threads",
+        str(os.cpu_count() or 4),
+        "-y" if overwrite else "-n",
+        str(output_file),
+    ]
+
+
 def to_gif(
     ctx: typer.Context,
-    input_file: Path = typer.Argument(
+    input_files: list[Path] = typer.Argument(
         ...,
-        help="Input video file to convert to GIF",
+        help="Input video file(s) to convert to GIF",
         exists=True,
         dir_okay=False,
         resolve_path=True,
     ),
     output_file: Path = typer.Argument(
         ...,
-        help="Output GIF file",
-        dir_okay=False,
+        help="Output GIF file (or directory when converting several inputs)",
         resolve_path=True,
     ),
     fps: int = typer.Option(
@@ -163,28 +248,37 @@ def to_gif(
         "--quality",
         "-q",
         help="Quality level: low, medium, high, or 1-10",
-        callback=lambda ctx, param, value: validate_quality(value) if value else "medium",
+        callback=lambda ctx, param, value: validate_quality(value)
+        if value
+        else "medium",
+    ),
+    max_colors: Optional[int] = typer.Option(
+        None,
+        "--max-colors",
+        help="Palette size in colors (overrides --quality; smaller is faster)",
+        min=2,
+        max=256,
     ),
     start: str = typer.Option(
         "0",
         "--start",
         "-t",
         help="Start time (HH:MM:SS, MM:SS, or seconds)",
-        callback=lambda ctx, param, value: parse_time(value) if value else "0",
+        callback=lambda ctx, param, value: _parse_time(value) if value else "0",
     ),
     end: Optional[str] = typer.Option(
         None,
         "--end",
         "-e",
         help="End time (HH:MM:SS, MM:SS, or seconds)",
-        callback=lambda ctx, param, value: parse_time(value) if value else None,
+        callback=lambda ctx, param, value: _parse_time(value) if value else None,
     ),
     duration: Optional[str] = typer.Option(
         None,
         "--duration",
         "-d",
         help="Duration to convert (HH:MM:SS, MM:SS, or seconds)",
-        callback=lambda ctx, param, value: parse_time(value) if value else None,
+        callback=lambda ctx, param, value: _parse_time(value) if value else None,
     ),
     loop: int = typer.Option(
         0,
@@ -198,21 +292,63 @@ def to_gif(
         help="Dithering algorithm",
         click_type=click.Choice(["none", "bayer", "floyd_steinberg"]),
     ),
+    palette_mode: Optional[str] = typer.Option(
+        None,
+        "--palette-mode",
+        help="Palette strategy: one global palette, or adapt per changed frame "
+        "(default: diff for high quality, global otherwise)",
+        click_type=click.Choice(["global", "diff", "single"]),
+    ),
     no_optimize: bool = typer.Option(
         False,
         "--no-optimize",
         help="Skip palette optimization (faster but lower quality)",
     ),
+    mpdecimate: bool = typer.Option(
+        False,
+        "--mpdecimate",
+        help="Drop near-duplicate frames before encoding (much smaller GIFs "
+        "from low-motion content)",
+    ),
+    palette: Optional[Path] = typer.Option(
+        None,
+        "--palette",
+        help="Reuse a pre-generated palette PNG, skipping the palettegen pass "
+        "(ignores --quality/--max-colors/--palette-mode)",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Max concurrent conversions when given several inputs (default: cores / 2)",
+        min=1,
+    ),
+    hwaccel: bool = typer.Option(
+        True,
+        "--hwaccel/--no-hwaccel",
+        help="Decode on the GPU when ffmpeg supports it",
+    ),
     overwrite: bool = typer.Option(
         False,
         "--overwrite",
         help="Overwrite output file if it exists",
     ),
+    no_clobber: bool = typer.Option(
+        False,
+        "--no-clobber",
+        help="Never overwrite an existing output; abort instead of prompting",
+    ),
 ) -> None:
     """
-    Convert a video to high-quality GIF format using two-pass optimization.
+    Convert one or more videos to high-quality GIF format.
 
-    Uses palette generation for better quality and smaller file sizes.
+    Palette generation and use run in a single ffmpeg pass for better
+    quality and smaller file sizes without decoding the input twice. With
+    several inputs, the output is a directory and conversions run in
+    parallel across a bounded worker pool.
 
     Examples:
         - Basic conversion: vidio to-gif video.mp4 output.gif
@@ -220,132 +356,154 @@ def to_gif(
         - Small file size: vidio to-gif video.mp4 output.gif --scale 0.3 --fps 8
         - Time range: vidio to-gif video.mp4 output.gif --start 10 --duration 5
         - Custom width: vidio to-gif video.mp4 output.gif --width 800
+        - Batch convert: vidio to-gif *.mp4 gifs/ --jobs 4
     """
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
 
+    multi = len(input_files) > 1
+
+    # A directory output is only meaningful in batch mode; keep the usage
+    # error dir_okay=False gave before the argument was relaxed for batches
+    if not multi and output_file.is_dir():
+        raise typer.BadParameter(f"File '{output_file}' is a directory.")
+
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
+    if not multi and not check_output_file(output_file, overwrite, no_clobber):
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    from vidio_cli.ffmpeg_utils import print_message, run_ffmpeg
+
     # Validate arguments
     if end and duration:
-        console.print("[red]Error: Cannot specify both --end and --duration[/red]")
+        print_message("[red]Error: Cannot specify both --end and --duration[/red]")
         raise typer.Exit(1)
-    
+
     if scale and width:
-        console.print("[red]Error: Cannot specify both --scale and --width[/red]")
+        print_message("[red]Error: Cannot specify both --scale and --width[/red]")
         raise typer.Exit(1)
 
-    # Check if output file exists and if we should overwrite it
-    if not check_output_file(output_file, overwrite):
-        console.print("[yellow]Aborted.[/yellow]")
-        raise typer.Exit(0)
-
-    # Get original video dimensions
-    try:
-        video_info = get_video_info(input_file, verbose)
-        video_streams = [s for s in video_info.get("streams", []) if s.get("codec_type") == "video"]
-        
-        if not video_streams:
-            console.print("[red]Error: No video stream found in input file[/red]")
+    if multi:
+        if output_file.exists() and not output_file.is_dir():
+            print_message(
+                "[red]Error: Output must be a directory when converting several inputs[/red]"
+            )
             raise typer.Exit(1)
-            
-        original_width = video_streams[0].get("width", 0)
-        original_height = video_streams[0].get("height", 0)
-        
-        if not original_width or not original_height:
-            console.print("[red]Error: Could not determine original video dimensions[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error reading video info: {e}[/red]")
-        raise typer.Exit(1)
-
-    # Build filter arguments
-    input_args, base_filter = build_filter_complex(
-        fps, width, scale, start, end, duration, original_width, original_height
-    )
+        output_file.mkdir(parents=True, exist_ok=True)
 
     # Show what we're doing
     if scale:
-        console.print(f"[blue]Converting to GIF with {scale}x scale at {fps} fps[/blue]")
+        print_message(
+            f"[blue]Converting to GIF with {scale}x scale at {fps} fps[/blue]"
+        )
     elif width:
-        console.print(f"[blue]Converting to GIF with width {width}px at {fps} fps[/blue]")
+        print_message(
+            f"[blue]Converting to GIF with width {width}px at {fps} fps[/blue]"
+        )
     else:
-        console.print(f"[blue]Converting to GIF at original size with {fps} fps[/blue]")
+        print_message(f"[blue]Converting to GIF at original size with {fps} fps[/blue]")
+
+    # High quality defaults to the per-scene-change palette; the other
+    # levels keep the single global palette
+    if palette_mode is None:
+        palette_mode = "diff" if quality == "high" else "global"
+
+    # Resolve the palette size once; an explicit --max-colors wins over
+    # the quality shortcut
+    if max_colors is None:
+        max_colors = _QUALITY_COLORS[quality]
 
     if no_optimize:
-        console.print("[yellow]Skipping palette optimization (faster but lower quality)[/yellow]")
-        
-        # Single-pass conversion without palette optimization
-        command = [
-            "ffmpeg",
-            *input_args,
-            "-i", str(input_file),
-            "-vf", base_filter,
-            "-loop", str(loop),
-            "-y" if overwrite else "-n",
-            str(output_file),
-        ]
-        
-        run_ffmpeg(command, verbose=verbose)
+        print_message(
+            "[yellow]Skipping palette optimization (faster but lower quality)[/yellow]"
+        )
     else:
-        console.print("[blue]Using two-pass conversion with palette optimization...[/blue]")
-        
-        # Two-pass conversion with palette optimization
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as palette_file:
-            palette_path = Path(palette_file.name)
-            
-        try:
-            # Pass 1: Generate palette
-            console.print("[dim]Pass 1: Generating optimal color palette...[/dim]")
-            
-            # Quality-based palette generation
-            if quality == "high":
-                palette_filter = f"{base_filter},palettegen=max_colors=256:reserve_transparent=0"
-            elif quality == "low":
-                palette_filter = f"{base_filter},palettegen=max_colors=128:reserve_transparent=0"
-            else:  # medium
-                palette_filter = f"{base_filter},palettegen=max_colors=192:reserve_transparent=0"
-            
-            palette_command = [
-                "ffmpeg",
-                *input_args,
-                "-i", str(input_file),
-                "-vf", palette_filter,
-                "-y",
-                str(palette_path),
-            ]
-            
-            run_ffmpeg(palette_command, verbose=verbose)
-            
-            # Pass 2: Create GIF with palette
-            console.print("[dim]Pass 2: Creating GIF with optimized palette...[/dim]")
-            
-            # Dithering options
-            dither_option = f"dither={dither}" if dither != "none" else "dither=none"
-            
-            gif_command = [
-                "ffmpeg",
-                *input_args,
-                "-i", str(input_file),
-                "-i", str(palette_path),
-                "-filter_complex", f"{base_filter}[x];[x][1:v]paletteuse={dither_option}",
-                "-loop", str(loop),
-                "-y" if overwrite else "-n",
-                str(output_file),
-            ]
-            
-            run_ffmpeg(gif_command, verbose=verbose)
-            
-        finally:
-            # Clean up temporary palette file
-            if palette_path.exists():
-                palette_path.unlink()
+        print_message(
+            "[blue]Using single-pass conversion with palette optimization...[/blue]"
+        )
+
+    # Offload decode to the GPU when one is available; the palette filters
+    # need CPU frames, so no -hwaccel_output_format is forced and ffmpeg
+    # downloads frames automatically after decode
+    use_hwaccel = False
+    if hwaccel:
+        from vidio_cli.ffmpeg_utils import detect_hwaccels
+
+        use_hwaccel = bool(detect_hwaccels())
+
+    # Build one ffmpeg command per input
+    conversions: list[tuple[Path, Path, list[str]]] = []
+
+    for input_file in input_files:
+        out = output_file / f"{input_file.stem}.gif" if multi else output_file
+
+        if multi and out.exists() and not overwrite:
+            print_message(
+                f"[yellow]Skipping {input_file.name}: {out.name} already exists "
+                "(use --overwrite)[/yellow]"
+            )
+            continue
+
+        # Build filter arguments; all size math happens inside ffmpeg, so
+        # no ffprobe pass over the input is needed
+        input_args, base_filter = build_filter_complex(
+            fps, width, scale, start, end, duration, mpdecimate
+        )
+        if use_hwaccel:
+            input_args = ["-hwaccel", "auto", *input_args]
+
+        command = _build_gif_command(
+            input_file,
+            out,
+            input_args,
+            base_filter,
+            max_colors,
+            dither,
+            palette_mode,
+            loop,
+            no_optimize,
+            overwrite,
+            palette=palette,
+        )
+        conversions.append((input_file, out, command))
+
+    if not conversions:
+        print_message("[yellow]Nothing to convert.[/yellow]")
+        return
+
+    if len(conversions) > 1:
+        # Fan the independent conversions out across the worker pool
+        from vidio_cli.ffmpeg_utils import run_ffmpeg_pool
+
+        returncodes = run_ffmpeg_pool(
+            [command for _, _, command in conversions], jobs=jobs, verbose=verbose
+        )
+
+        failures = 0
+        for (input_file, out, _), returncode in zip(conversions, returncodes):
+            if returncode == 0 and out.exists():
+                print_message(f"[green]✓[/green] GIF created: {out}")
+            else:
+                print_message(f"[red]Failed to convert {input_file.name}[/red]")
+                failures += 1
+
+        if failures:
+            raise typer.Exit(1)
+        return
+
+    _, out, command = conversions[0]
+    run_ffmpeg(command, verbose=verbose)
 
     # Show file size info
-    if output_file.exists():
-        file_size = output_file.stat().st_size
+    if out.exists():
+        file_size = out.stat().st_size
         size_mb = file_size / (1024 * 1024)
-        console.print(f"[green]✓[/green] GIF created: {output_file}")
-        console.print(f"[dim]File size: {size_mb:.2f} MB ({file_size:,} bytes)[/dim]")
+        print_message(f"[green]✓[/green] GIF created: {out}")
+        print_message(f"[dim]File size: {size_mb:.2f} MB ({file_size:,} bytes)[/dim]")
     else:
-        console.print("[red]Error: GIF file was not created[/red]")
+        print_message("[red]Error: GIF file was not created[/red]")
         raise typer.Exit(1)
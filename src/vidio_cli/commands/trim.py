@@ -1,13 +1,9 @@
 """Command module for trimming videos by time range."""
 
 from pathlib import Path
+from typing import Optional
 
 import typer
-from rich.console import Console
-
-from vidio_cli.ffmpeg_utils import check_output_file, run_ffmpeg
-
-console = Console()
 
 
 def register(app: typer.Typer) -> None:
@@ -20,41 +16,103 @@ def register(app: typer.Typer) -> None:
     app.command(no_args_is_help=True)(trim)
 
 
-def parse_time(time_str: str) -> str:
+def _parse_time(value: str) -> str:
+    """Validate a time option, deferring the ffmpeg_utils import to parse time."""
+    from vidio_cli.ffmpeg_utils import parse_time
+
+    return parse_time(value)
+
+
+def _time_to_seconds(time_str: str) -> "float | None":
+    """
+    Convert an ffmpeg time string ("90", "1:30", "01:02:03.5") to seconds.
+
+    Args:
+        time_str: The time string.
+
+    Returns:
+        float | None: Seconds, or None if the string is not convertible.
+    """
+    try:
+        parts = [float(p) for p in time_str.split(":")]
+    except ValueError:
+        return None
+
+    seconds = 0.0
+    for part in parts:
+        seconds = seconds * 60 + part
+    return seconds
+
+
+def find_nearest_keyframe(
+    input_file: Path, target: float, verbose: bool = False
+) -> "float | None":
     """
-    Parse and validate time format.
-    
+    Find the timestamp of the nearest keyframe at or before a target time.
+
+    Only a 5-second window around the target is demuxed (-read_intervals
+    with -skip_frame nokey), so the check stays cheap even on long files.
+
     Args:
-        time_str: Time string in format like "00:01:30", "90", "1:30"
-        
+        input_file: Path to the video file.
+        target: Target time in seconds.
+        verbose: If True, show the ffprobe command.
+
     Returns:
-        str: Validated time string for ffmpeg
+        float | None: Keyframe timestamp, or None if none was found.
     """
-    # If it's just numbers, assume seconds
-    if time_str.isdigit():
-        return time_str
-    
-    # Basic validation for HH:MM:SS or MM:SS format
-    parts = time_str.split(":")
-    if len(parts) > 3:
-        raise typer.BadParameter("Time format should be HH:MM:SS, MM:SS, or seconds")
-    
-    return time_str
+    from vidio_cli.ffmpeg_utils import run_command
+
+    window_start = max(0.0, target - 5.0)
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-skip_frame",
+        "nokey",
+        "-show_entries",
+        "frame=pts_time",
+        "-of",
+        "csv=p=0",
+        "-read_intervals",
+        f"{window_start}%{target + 5.0}",
+        str(input_file),
+    ]
+
+    try:
+        result = run_command(command, verbose=verbose, check=False, capture_output=True)
+    except OSError:
+        return None
+
+    if result.returncode != 0 or not result.stdout:
+        return None
+
+    keyframes = []
+    for line in result.stdout.split():
+        try:
+            timestamp = float(line.strip(","))
+        except ValueError:
+            continue
+        if timestamp <= target + 0.001:
+            keyframes.append(timestamp)
+
+    return max(keyframes) if keyframes else None
 
 
 def trim(
     ctx: typer.Context,
-    input_file: Path = typer.Argument(
+    input_files: list[Path] = typer.Argument(
         ...,
-        help="Input video file to trim",
+        help="Input video file(s) to trim",
         exists=True,
         dir_okay=False,
         resolve_path=True,
     ),
     output_file: Path = typer.Argument(
         ...,
-        help="Output video file",
-        dir_okay=False,
+        help="Output video file (or directory when trimming several inputs)",
         resolve_path=True,
     ),
     start: str = typer.Option(
@@ -62,72 +120,183 @@ def trim(
         "--start",
         "-s",
         help="Start time (HH:MM:SS, MM:SS, or seconds)",
-        callback=lambda ctx, param, value: parse_time(value) if value else "0",
+        callback=lambda ctx, param, value: _parse_time(value) if value else "0",
     ),
     end: str = typer.Option(
         None,
         "--end",
         "-e",
         help="End time (HH:MM:SS, MM:SS, or seconds). If not specified, trim to end of video",
-        callback=lambda ctx, param, value: parse_time(value) if value else None,
+        callback=lambda ctx, param, value: _parse_time(value) if value else None,
     ),
     duration: str = typer.Option(
         None,
         "--duration",
         "-d",
         help="Duration to trim (HH:MM:SS, MM:SS, or seconds). Alternative to --end",
-        callback=lambda ctx, param, value: parse_time(value) if value else None,
+        callback=lambda ctx, param, value: _parse_time(value) if value else None,
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Max concurrent trims when given several inputs (default: cores / 2)",
+        min=1,
     ),
     overwrite: bool = typer.Option(
         False,
         "--overwrite",
         help="Overwrite output file if it exists",
     ),
+    no_clobber: bool = typer.Option(
+        False,
+        "--no-clobber",
+        help="Never overwrite an existing output; abort instead of prompting",
+    ),
 ) -> None:
     """
-    Trim a video by specifying start and end times or duration.
+    Trim one or more videos by specifying start and end times or duration.
+
+    With several inputs, the output is a directory and the trims run in
+    parallel across a bounded worker pool.
 
     Examples:
         - Trim from 30s to 90s: vidio trim input.mp4 output.mp4 --start 30 --end 90
         - Trim from 1:30 for 45 seconds: vidio trim input.mp4 output.mp4 --start 1:30 --duration 45
         - Trim from beginning to 2:15: vidio trim input.mp4 output.mp4 --end 2:15
         - Trim last 30 seconds: vidio trim input.mp4 output.mp4 --start -30
+        - Batch trim: vidio trim *.mp4 trimmed/ --end 10 --jobs 4
     """
     # Get verbose flag from global context
     verbose = ctx.obj.get("VERBOSE", False) if ctx.obj else False
 
+    multi = len(input_files) > 1
+
+    # A directory output is only meaningful in batch mode; keep the usage
+    # error dir_okay=False gave before the argument was relaxed for batches
+    if not multi and output_file.is_dir():
+        raise typer.BadParameter(f"File '{output_file}' is a directory.")
+
+    from vidio_cli.ffmpeg_utils import check_output_file
+
+    # Check if output file exists and if we should overwrite it; done
+    # before any console work so the aborted path never imports rich
+    if not multi and not check_output_file(output_file, overwrite, no_clobber):
+        typer.secho("Aborted.", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=0)
+
+    from vidio_cli.ffmpeg_utils import print_message, run_ffmpeg
+
     # Validate arguments
     if end and duration:
-        console.print("[red]Error: Cannot specify both --end and --duration[/red]")
+        print_message("[red]Error: Cannot specify both --end and --duration[/red]")
         raise typer.Exit(1)
 
-    # Check if output file exists and if we should overwrite it
-    if not check_output_file(output_file, overwrite):
-        console.print("[yellow]Aborted.[/yellow]")
-        raise typer.Exit(0)
-
-    # Build the ffmpeg command
-    command = ["ffmpeg", "-i", str(input_file)]
-
-    # Add start time if specified
-    if start != "0":
-        command.extend(["-ss", start])
-
-    # Add end time or duration
-    if end:
-        command.extend(["-to", end])
-    elif duration:
-        command.extend(["-t", duration])
-
-    # Add output options
-    command.extend([
-        "-c", "copy",  # Copy streams without re-encoding for speed
-        "-avoid_negative_ts", "make_zero",  # Handle negative timestamps
-        "-y" if overwrite else "-n",  # Overwrite if specified
-        str(output_file),
-    ])
-
-    # Run the command
+    if multi:
+        if output_file.exists() and not output_file.is_dir():
+            print_message(
+                "[red]Error: Output must be a directory when trimming several inputs[/red]"
+            )
+            raise typer.Exit(1)
+        output_file.mkdir(parents=True, exist_ok=True)
+
+    # Build one ffmpeg command per input
+    trims: list[tuple[Path, Path, list[str]]] = []
+
+    for input_file in input_files:
+        out = (
+            output_file / f"{input_file.stem}_trimmed{input_file.suffix}"
+            if multi
+            else output_file
+        )
+
+        if multi and out.exists() and not overwrite:
+            print_message(
+                f"[yellow]Skipping {input_file.name}: {out.name} already exists "
+                "(use --overwrite)[/yellow]"
+            )
+            continue
+
+        # Stream copy is only frame-accurate when the cut starts on a
+        # keyframe; check where the start lands and fall back to
+        # re-encoding when it falls mid-GOP, which with -c copy would
+        # produce black or frozen frames until the next keyframe
+        reencode = False
+        start_seconds = _time_to_seconds(start) if start != "0" else None
+        if start_seconds is not None and start_seconds > 0:
+            keyframe = find_nearest_keyframe(input_file, start_seconds, verbose)
+            if keyframe is None or abs(keyframe - start_seconds) > 0.1:
+                print_message(
+                    f"[yellow]{input_file.name}: start time is not on a keyframe; "
+                    "re-encoding for frame accuracy[/yellow]"
+                )
+                reencode = True
+
+        # Seek on the input side where possible: -ss before -i jumps by
+        # keyframe index instead of decoding from time zero, turning an
+        # O(start) seek into an effectively constant one
+        fast_seek = start_seconds is not None and start_seconds > 0
+
+        command = ["ffmpeg"]
+        if fast_seek:
+            command.extend(["-ss", start])
+        command.extend(["-i", str(input_file)])
+        if start != "0" and not fast_seek:
+            # Negative start (trim the tail) keeps the output-side seek
+            command.extend(["-ss", start])
+
+        # Add end time or duration; with an input-side seek the timestamps
+        # restart at zero, so an absolute --end becomes a -t duration
+        if end:
+            end_seconds = _time_to_seconds(end)
+            if fast_seek and end_seconds is not None:
+                command.extend(["-t", f"{end_seconds - start_seconds:g}"])
+            else:
+                command.extend(["-to", end])
+        elif duration:
+            command.extend(["-t", duration])
+
+        # Add output options
+        if reencode:
+            command.extend(["-c:v", "libx264", "-preset", "fast", "-c:a", "aac"])
+        else:
+            command.extend(["-c", "copy"])  # Copy streams without re-encoding for speed
+        command.extend(
+            [
+                "-avoid_negative_ts",
+                "make_zero",  # Handle negative timestamps
+                "-y" if overwrite else "-n",  # Overwrite if specified
+                str(out),
+            ]
+        )
+
+        trims.append((input_file, out, command))
+
+    if not trims:
+        print_message("[yellow]Nothing to trim.[/yellow]")
+        return
+
+    if len(trims) > 1:
+        # Fan the independent trims out across the worker pool
+        from vidio_cli.ffmpeg_utils import run_ffmpeg_pool
+
+        returncodes = run_ffmpeg_pool(
+            [command for _, _, command in trims], jobs=jobs, verbose=verbose
+        )
+
+        failures = 0
+        for (input_file, out, _), returncode in zip(trims, returncodes):
+            if returncode == 0 and out.exists():
+                print_message(f"[green]✓[/green] Trimmed video saved to {out}")
+            else:
+                print_message(f"[red]Failed to trim {input_file.name}[/red]")
+                failures += 1
+
+        if failures:
+            raise typer.Exit(1)
+        return
+
+    _, out, command = trims[0]
     run_ffmpeg(command, verbose=verbose)
 
-    console.print(f"[green]✓[/green] Trimmed video saved to {output_file}")
\ No newline at end of file
+    print_message(f"[green]✓[/green] Trimmed video saved to {out}")
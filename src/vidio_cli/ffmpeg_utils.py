@@ -1,63 +1,253 @@
 """Utilities for working with ffmpeg."""
 
+import collections
+import functools
+import hashlib
 import json
+import os
+import re
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
 
-console = Console()
-error_console = Console(stderr=True)
+try:  # C-accelerated JSON for ffprobe output; fall back to stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
+if TYPE_CHECKING:
+    import asyncio
 
+    from rich.console import Console
+
+
+def json_loads(data: "str | bytes") -> dict:
+    """
+    Parse JSON with orjson when available, stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data, indent: bool = False) -> str:
+    """
+    Serialize to JSON with orjson when available, stdlib json otherwise.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None)
+
+
+@functools.cache
+def get_console() -> "Console":
+    """
+    Return the shared stdout console, constructing it on first use.
+
+    Both the rich import and Console construction (which probes terminal
+    capabilities) are deferred until something actually prints.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.cache
+def get_error_console() -> "Console":
+    """
+    Return the shared stderr console, constructing it on first use.
+    """
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+# The rich markup tags this package uses in status messages. Deliberately
+# narrow so filter-graph labels like [0:v] or [v0] are never touched.
+_MARKUP_RE = re.compile(
+    r"\[/?(?:bold )?(?:red|green|yellow|blue|cyan|magenta|dim|bold)\]"
+)
+
+
+@functools.cache
+def _stdout_is_tty() -> bool:
+    """Check once whether stdout is attached to a terminal."""
+    return sys.stdout.isatty()
+
+
+def print_message(message: str) -> None:
+    """
+    Print a status message, with rich styling only on a TTY.
+
+    When stdout is piped, the markup tags are stripped with one regex pass
+    and the text goes through typer.echo, skipping rich's markup tokenizer
+    and render pipeline entirely.
+
+    Args:
+        message: The message, possibly containing rich markup tags.
+    """
+    if _stdout_is_tty():
+        get_console().print(message)
+    else:
+        typer.echo(_MARKUP_RE.sub("", message))
+
+
+# Accepts [HH:]MM:SS with optional fraction, or plain (possibly negative)
+# seconds; compiled once so option callbacks do a single match
+_TIME_RE = re.compile(r"^(\d{1,2}:)?\d{1,2}:\d{1,2}(\.\d+)?$|^-?\d+(\.\d+)?$")
+
+
+@functools.lru_cache(maxsize=128)
+def parse_time(time_str: str) -> str:
+    """
+    Parse and validate a time option value.
+
+    Shared by the trim and to-gif option callbacks; results are memoized
+    since batch invocations pass the same few values repeatedly.
+
+    Args:
+        time_str: Time string in format like "00:01:30", "90", "1:30"
+
+    Returns:
+        str: Validated time string for ffmpeg
+
+    Raises:
+        typer.BadParameter: If the value is not a recognized time format.
+    """
+    if not _TIME_RE.match(time_str):
+        raise typer.BadParameter("Time format should be HH:MM:SS, MM:SS, or seconds")
+    return time_str
+
+
+@functools.cache
 def check_ffmpeg() -> bool:
     """
     Check if ffmpeg is available on the system.
 
+    The PATH walk is memoized; availability cannot change within one CLI
+    invocation, so repeated calls cost a cache lookup.
+
     Returns:
         bool: True if ffmpeg is available, False otherwise.
     """
     return shutil.which("ffmpeg") is not None
 
 
+@functools.cache
 def check_ffprobe() -> bool:
     """
     Check if ffprobe is available on the system.
 
+    Memoized like check_ffmpeg().
+
     Returns:
         bool: True if ffprobe is available, False otherwise.
     """
     return shutil.which("ffprobe") is not None
 
 
+@functools.cache
 def ensure_ffmpeg():
     """
     Ensure that ffmpeg is available, or exit with an error message.
+
+    The check is memoized, so repeated calls within one process only
+    probe PATH once.
     """
     if not check_ffmpeg():
-        error_console.print("[bold red]Error:[/bold red] ffmpeg not found in PATH")
-        error_console.print("Please install ffmpeg and make sure it's in your PATH.")
-        error_console.print(
+        get_error_console().print(
+            "[bold red]Error:[/bold red] ffmpeg not found in PATH"
+        )
+        get_error_console().print(
+            "Please install ffmpeg and make sure it's in your PATH."
+        )
+        get_error_console().print(
             "Installation instructions: https://ffmpeg.org/download.html"
         )
         raise typer.Exit(code=1)
 
 
+@functools.cache
 def ensure_ffprobe():
     """
     Ensure that ffprobe is available, or exit with an error message.
+
+    Memoized like ensure_ffmpeg(); a raised Exit is not cached, so a
+    missing binary is still reported on every call.
     """
     if not check_ffprobe():
-        error_console.print("[bold red]Error:[/bold red] ffprobe not found in PATH")
-        error_console.print("Please install ffmpeg (includes ffprobe).")
-        error_console.print(
+        get_error_console().print(
+            "[bold red]Error:[/bold red] ffprobe not found in PATH"
+        )
+        get_error_console().print("Please install ffmpeg (includes ffprobe).")
+        get_error_console().print(
             "Installation instructions: https://ffmpeg.org/download.html"
         )
         raise typer.Exit(code=1)
 
 
+@functools.cache
+def detect_hwaccels() -> frozenset:
+    """
+    Return the set of hardware acceleration methods ffmpeg supports.
+
+    The result of ``ffmpeg -hwaccels`` is cached on disk (keyed by the
+    resolved ffmpeg binary) so the extra subprocess only runs once per
+    ffmpeg installation, and memoized in-process on top of that.
+
+    Returns:
+        frozenset: Lowercase hwaccel names (e.g. {"cuda", "vaapi"}),
+        empty if detection fails.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return frozenset()
+
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    cache_file = cache_root / "vidio" / "hwaccels.json"
+
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if cached.get("ffmpeg") == ffmpeg_path:
+            return frozenset(cached["hwaccels"])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # Output is a header line followed by one method name per line
+    hwaccels = frozenset(
+        line.strip().lower() for line in result.stdout.splitlines()[1:] if line.strip()
+    )
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(json_dumps({"ffmpeg": ffmpeg_path, "hwaccels": sorted(hwaccels)}))
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
+    return hwaccels
+
+
 def run_command(
     command: list[str],
     verbose: bool = False,
@@ -78,7 +268,7 @@ def run_command(
         subprocess.CompletedProcess: The completed process.
     """
     if verbose:
-        console.print(f"Running: [dim]{' '.join(command)}[/dim]")
+        get_console().print(f"Running: [dim]{' '.join(command)}[/dim]")
 
     # Determine stdout/stderr handling
     if capture_output:
@@ -94,29 +284,76 @@ def run_command(
         stderr = subprocess.PIPE
 
     try:
-        result = subprocess.run(
+        # A 1 MiB pipe buffer drains ffmpeg's chatty stderr in large reads
+        # instead of one syscall per progress line
+        # close_fds=False keeps Popen on the posix_spawn fast path and
+        # skips walking the fd table; safe here because vidio opens no
+        # inheritable descriptors beyond the redirected stdio
+        proc = subprocess.Popen(
             command,
             stdout=stdout,
             stderr=stderr,
             text=True,
-            check=check,
+            bufsize=1 << 20,
+            close_fds=False,
         )
+        # Drain stderr through a bounded ring buffer on a helper thread:
+        # only the last ~64 KB are kept for error reporting, so RSS stays
+        # flat however chatty a long encode gets
+        drain = None
+        err = None
+        if proc.stderr is not None:
+            chunks: collections.deque = collections.deque(maxlen=16)
+
+            def _drain_stderr() -> None:
+                while True:
+                    chunk = proc.stderr.read(4096)
+                    if not chunk:
+                        return
+                    chunks.append(chunk)
+
+            drain = threading.Thread(target=_drain_stderr, daemon=True)
+            drain.start()
+
+        out = proc.stdout.read() if proc.stdout is not None else None
+        proc.wait()
+        if drain is not None:
+            drain.join()
+            err = "".join(chunks)
+
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, command, out, err)
+
+        result = subprocess.CompletedProcess(command, proc.returncode, out, err)
 
         # If verbose and we captured output, show it
         if verbose and capture_output:
             if result.stdout:
-                console.print(result.stdout)
+                get_console().print(result.stdout)
             if result.stderr:
-                console.print(result.stderr, style="red")
+                get_console().print(result.stderr, style="red")
 
         return result
     except subprocess.CalledProcessError as e:
-        error_console.print(f"[bold red]Error:[/bold red] {command[0]} command failed")
+        get_error_console().print(
+            f"[bold red]Error:[/bold red] {command[0]} command failed"
+        )
         if e.stderr:
-            error_console.print(e.stderr)
+            get_error_console().print(e.stderr)
         raise typer.Exit(code=1)
 
 
+# Every format/stream field any command actually reads. Constraining the
+# probe to these keeps ffprobe's JSON output (and our json.loads) small
+# while leaving the returned schema unchanged.
+_PROBE_ENTRIES = (
+    "format=duration,size,bit_rate,format_name"
+    ":stream=codec_type,codec_name,width,height,nb_frames,pix_fmt,"
+    "r_frame_rate,sample_rate,channels,bit_rate,color_space"
+    ":stream_tags=language"
+)
+
+
 def get_video_info(file_path: Path, verbose: bool = False) -> dict:
     """
     Get video information using ffprobe.
@@ -135,27 +372,296 @@ def get_video_info(file_path: Path, verbose: bool = False) -> dict:
         "quiet",
         "-print_format",
         "json",
-        "-show_format",
-        "-show_streams",
+        "-show_entries",
+        _PROBE_ENTRIES,
         str(file_path),
     ]
 
     try:
         result = run_command(command, verbose=verbose, check=True, capture_output=True)
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        error_console.print(
+        return json_loads(result.stdout)
+    except ValueError:
+        get_error_console().print(
             "[bold red]Error:[/bold red] Failed to parse ffprobe output."
         )
         raise typer.Exit(code=1)
 
 
+def get_video_dimensions(file_path: Path, verbose: bool = False) -> tuple[int, int]:
+    """
+    Get the dimensions of the first video stream.
+
+    Reads through the probe cache, so repeated dimension lookups on an
+    unchanged file (common when chaining commands or in test runs) never
+    spawn a second ffprobe.
+
+    Args:
+        file_path: Path to the video file.
+        verbose: If True, show ffprobe commands and other debug info.
+
+    Returns:
+        tuple[int, int]: (width, height) of the first video stream, or (0, 0)
+        if no video stream was found.
+    """
+    ensure_ffprobe()
+    info = get_cached_video_info(file_path, verbose)
+
+    for stream in info.get("streams", []):
+        if stream.get("codec_type") == "video":
+            return stream.get("width", 0), stream.get("height", 0)
+    return 0, 0
+
+
+def _probe_cache_dir() -> Path:
+    """
+    Return the directory used for cached ffprobe results.
+
+    Returns:
+        Path: The cache directory (not necessarily existing yet).
+    """
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_root / "vidio" / "ffprobe"
+
+
+def _cache_file_for(file_path: Path) -> Path:
+    """Return the cache file used for a given video path."""
+    key = hashlib.sha1(str(file_path).encode()).hexdigest()
+    return _probe_cache_dir() / f"{key}.json"
+
+
+def _read_cached_info(cache_file: Path, stat_key: list) -> "dict | None":
+    """Return the cached info if it exists and matches the fingerprint."""
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if cached.get("stat") == stat_key:
+            return cached["info"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _write_cached_info(cache_file: Path, stat_key: list, info: dict) -> None:
+    """
+    Store probe results in the cache.
+
+    Writes through a tempfile + os.replace so concurrent runs never read
+    a half-written cache entry.
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(json_dumps({"stat": stat_key, "info": info}))
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
+
+# Process-level probe memo keyed by (path, fingerprint). ffprobe has no
+# server mode to keep warm across files, so within one invocation this
+# layer plays that role: the second probe of an unchanged file costs a
+# dict lookup, not even a cache-file read.
+_info_memo: dict = {}
+
+
+def get_cached_video_info(
+    file_path: Path, verbose: bool = False, refresh: bool = False
+) -> dict:
+    """
+    Get video information using ffprobe, with in-process and on-disk caches.
+
+    Cached results are keyed by the file's path, mtime, size and inode, so
+    repeated invocations on an unchanged file skip the ffprobe subprocess
+    entirely; repeated calls within one process also skip the cache-file
+    read.
+
+    Args:
+        file_path: Path to the video file.
+        verbose: If True, show ffprobe commands and other debug info.
+        refresh: If True, ignore any cached entry and re-probe the file.
+
+    Returns:
+        dict: The video information as a dictionary.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return get_video_info(file_path, verbose)
+
+    stat_key = [st.st_mtime_ns, st.st_size, st.st_ino]
+    memo_key = (str(file_path), tuple(stat_key))
+    cache_file = _cache_file_for(file_path)
+
+    if not refresh:
+        if memo_key in _info_memo:
+            return _info_memo[memo_key]
+        cached = _read_cached_info(cache_file, stat_key)
+        if cached is not None:
+            _info_memo[memo_key] = cached
+            return cached
+
+    info = get_video_info(file_path, verbose)
+    _info_memo[memo_key] = info
+    _write_cached_info(cache_file, stat_key, info)
+    return info
+
+
+async def _probe_async(
+    path: Path, verbose: bool, semaphore: "asyncio.Semaphore"
+) -> "dict | None":
+    """Run one ffprobe asynchronously, bounded by the shared semaphore."""
+    import asyncio
+
+    command = [
+        "ffprobe",
+        "-v",
+        "quiet",
+        "-print_format",
+        "json",
+        "-show_entries",
+        _PROBE_ENTRIES,
+        str(path),
+    ]
+    if verbose:
+        get_console().print(f"Running: [dim]{' '.join(command)}[/dim]")
+
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+
+    if proc.returncode != 0:
+        return None
+    try:
+        return json_loads(stdout)
+    except ValueError:
+        return None
+
+
+def batch_probe(
+    paths: list[Path], verbose: bool = False, refresh: bool = False
+) -> "dict[Path, dict | None]":
+    """
+    Probe many files at once and return their info keyed by path.
+
+    ffprobe only accepts a single input per invocation, so the batching is
+    done on our side: unchanged files are answered from the on-disk cache
+    without spawning anything, and the remaining probes run as asyncio
+    subprocesses reaped by one event loop, capped by a semaphore so huge
+    directories cannot exhaust file descriptors.
+
+    Args:
+        paths: The video files to probe.
+        verbose: If True, show ffprobe commands and other debug info.
+        refresh: If True, bypass the probe cache and re-run ffprobe.
+
+    Returns:
+        dict: Info dict per path, or None for files that failed to probe.
+    """
+    import asyncio
+
+    ensure_ffprobe()
+
+    results: "dict[Path, dict | None]" = {}
+    to_probe: list[Path] = []
+    stat_keys: dict[Path, list] = {}
+
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            results[path] = None
+            continue
+
+        stat_keys[path] = [st.st_mtime_ns, st.st_size, st.st_ino]
+        if not refresh:
+            cached = _read_cached_info(_cache_file_for(path), stat_keys[path])
+            if cached is not None:
+                results[path] = cached
+                continue
+        to_probe.append(path)
+
+    if to_probe:
+
+        async def _run() -> list:
+            semaphore = asyncio.Semaphore(32)
+            return await asyncio.gather(
+                *(_probe_async(path, verbose, semaphore) for path in to_probe)
+            )
+
+        for path, info in zip(to_probe, asyncio.run(_run())):
+            results[path] = info
+            if info is not None:
+                _write_cached_info(_cache_file_for(path), stat_keys[path], info)
+
+    return results
+
+
+def _ffmpeg_thread_count(jobs: int = 1) -> int:
+    """
+    Pick a -threads value for one ffmpeg out of `jobs` running in parallel.
+
+    Honors the VIDIO_FFMPEG_THREADS override, then the process CPU
+    affinity mask (cgroup/taskset aware) where the platform supports it,
+    so batch mode does not oversubscribe the cores.
+
+    Args:
+        jobs: How many ffmpeg processes share the machine.
+
+    Returns:
+        int: Thread count for a single ffmpeg.
+    """
+    env_threads = os.environ.get("VIDIO_FFMPEG_THREADS")
+    if env_threads and env_threads.isdigit():
+        return int(env_threads)
+
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # macOS/Windows have no affinity mask
+        cores = os.cpu_count() or 4
+
+    return max(1, cores // max(1, jobs))
+
+
+def _apply_test_fast(command: list[str]) -> list[str]:
+    """
+    Inject fast-encode flags when VIDIO_TEST_FAST is set.
+
+    Set by the test suite: skips input analysis (-probesize/-analyzeduration)
+    and forces the cheapest x264 settings, trading quality for wall time
+    without touching any user-visible option. No-op otherwise.
+    """
+    if not os.environ.get("VIDIO_TEST_FAST"):
+        return command
+
+    fast = list(command)
+    if "-i" in fast:
+        index = fast.index("-i")
+        fast[index:index] = ["-probesize", "32", "-analyzeduration", "0"]
+    fast[-1:-1] = ["-preset", "ultrafast", "-g", "1", "-tune", "zerolatency"]
+    return fast
+
+
+def _with_thread_count(command: list[str], jobs: int = 1) -> list[str]:
+    """Insert a -threads option unless the command already sets one."""
+    if "-threads" in command:
+        return command
+    return [*command[:-1], "-threads", str(_ffmpeg_thread_count(jobs)), command[-1]]
+
+
 def run_ffmpeg(
     command: list[str], verbose: bool = False, check: bool = True
 ) -> subprocess.CompletedProcess:
     """
     Run an ffmpeg command and handle output/errors.
 
+    Commands that do not set -threads themselves get one sized to the
+    usable core count.
+
     Args:
         command: List of command arguments, starting with ["ffmpeg", ...]
         verbose: If True, print the command and show ffmpeg output.
@@ -170,17 +676,77 @@ def run_ffmpeg(
     # so users can see progress in real-time
     capture_output = not verbose
     return run_command(
-        command, verbose=verbose, check=check, capture_output=capture_output
+        _apply_test_fast(_with_thread_count(command)),
+        verbose=verbose,
+        check=check,
+        capture_output=capture_output,
     )
 
 
-def check_output_file(output_file: Path, force_overwrite: bool = False) -> bool:
+def run_ffmpeg_pool(
+    commands: "list[list[str]]", jobs: "int | None" = None, verbose: bool = False
+) -> list[int]:
+    """
+    Run several independent ffmpeg commands through a bounded worker pool.
+
+    Each ffmpeg is already multi-threaded internally, so the pool defaults
+    to half the core count; the commands run as asyncio subprocesses like
+    batch_probe's, capped by a semaphore.
+
+    Args:
+        commands: ffmpeg argument lists, one per job.
+        jobs: Maximum commands to run concurrently (default: cores / 2).
+        verbose: If True, print each command as it starts.
+
+    Returns:
+        list[int]: Return codes, in the same order as the commands.
+    """
+    import asyncio
+
+    ensure_ffmpeg()
+
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+
+    # Split the usable cores across the pool so concurrent ffmpeg runs do
+    # not oversubscribe each other
+    commands = [
+        _apply_test_fast(_with_thread_count(command, jobs)) for command in commands
+    ]
+
+    async def _run_one(command: list[str], semaphore: "asyncio.Semaphore") -> int:
+        if verbose:
+            get_console().print(f"Running: [dim]{' '.join(command)}[/dim]")
+        async with semaphore:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+        if proc.returncode != 0 and stderr:
+            get_error_console().print(stderr.decode(errors="replace"))
+        return proc.returncode
+
+    async def _run_all() -> list[int]:
+        semaphore = asyncio.Semaphore(jobs)
+        return await asyncio.gather(
+            *(_run_one(command, semaphore) for command in commands)
+        )
+
+    return asyncio.run(_run_all())
+
+
+def check_output_file(
+    output_file: Path, force_overwrite: bool = False, no_clobber: bool = False
+) -> bool:
     """
     Check if an output file exists and prompt for overwrite if needed.
 
     Args:
         output_file: Path to the output file.
         force_overwrite: If True, overwrite without prompting.
+        no_clobber: If True, refuse to overwrite without prompting.
 
     Returns:
         bool: True if it's safe to write to the file, False otherwise.
@@ -191,6 +757,9 @@ def check_output_file(output_file: Path, force_overwrite: bool = False) -> bool:
     if force_overwrite:
         return True
 
+    if no_clobber:
+        return False
+
     overwrite = typer.confirm(
         f"Output file {output_file} already exists. Overwrite?", default=False
     )
@@ -0,0 +1,15 @@
+"""Shared ffmpeg availability guard for the integration test modules."""
+
+import pytest
+
+from vidio_cli.ffmpeg_utils import check_ffmpeg
+
+# check_ffmpeg is memoized, so the PATH lookup runs once per interpreter
+# however many test modules evaluate this at import time.
+FFMPEG_AVAILABLE = check_ffmpeg()
+
+# Integration tests require ffmpeg and real media assets.
+requires_ffmpeg = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not FFMPEG_AVAILABLE, reason="ffmpeg is not available"),
+]
@@ -1,18 +1,214 @@
 """Shared pytest helpers."""
 
-import re
+import os
+from pathlib import Path
 
 import pytest
 
 
-ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+@pytest.fixture(autouse=True, scope="session")
+def fast_encode():
+    """
+    Trade encode quality for speed in every ffmpeg run during tests.
 
+    The tests only assert exit codes and output existence, so run_ffmpeg's
+    VIDIO_TEST_FAST mode (skip input analysis, cheapest x264 settings)
+    keeps the suite's ffmpeg time to a minimum.
+    """
+    already_set = "VIDIO_TEST_FAST" in os.environ
+    os.environ.setdefault("VIDIO_TEST_FAST", "1")
+    yield
+    if not already_set:
+        os.environ.pop("VIDIO_TEST_FAST", None)
 
-@pytest.fixture
-def clean_output():
-    """Return a helper that strips ANSI color/style escape codes."""
 
-    def _clean_output(text: str) -> str:
-        return ANSI_ESCAPE_RE.sub("", text)
+@pytest.fixture(autouse=True, scope="session")
+def bounded_ffmpeg_threads():
+    """
+    Budget ffmpeg threads across xdist workers.
 
-    return _clean_output
+    Each spawned ffmpeg defaults to one thread per core, so N parallel
+    workers would oversubscribe the machine N-fold. Split the cores
+    between workers via the VIDIO_FFMPEG_THREADS override that
+    run_ffmpeg already honors; serial runs and explicit overrides are
+    left alone.
+    """
+    worker_count = os.environ.get("PYTEST_XDIST_WORKER_COUNT")
+    if not worker_count or "VIDIO_FFMPEG_THREADS" in os.environ:
+        yield
+        return
+
+    threads = max(1, (os.cpu_count() or 1) // int(worker_count))
+    os.environ["VIDIO_FFMPEG_THREADS"] = str(threads)
+    yield
+    os.environ.pop("VIDIO_FFMPEG_THREADS", None)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def validate_outputs(tmp_path_factory):
+    """
+    Batch-probe every media file the tests produced, once, at teardown.
+
+    The per-test assertions only check exit codes and non-empty outputs;
+    this sweep catches structurally broken files a zero-size check would
+    miss, at the cost of one concurrent batch_probe pass instead of an
+    ffprobe spawn per test.
+    """
+    yield
+
+    from vidio_cli.ffmpeg_utils import batch_probe, check_ffprobe
+
+    if not check_ffprobe():
+        return
+
+    base = tmp_path_factory.getbasetemp()
+    shared = shared_asset_dir(tmp_path_factory)
+    outputs = [
+        p
+        for p in base.rglob("*")
+        if p.suffix in {".mp4", ".gif"}
+        and p.stat().st_size > 0
+        and shared not in p.parents
+    ]
+    if not outputs:
+        return
+
+    results = batch_probe(outputs, refresh=True)
+    broken = sorted(str(p) for p, info in results.items() if info is None)
+    assert not broken, f"tests produced unreadable media outputs: {broken}"
+
+
+@pytest.fixture(autouse=True)
+def plain_term(monkeypatch):
+    """
+    Force plain-text terminal rendering for every CLI invocation.
+
+    With NO_COLOR/TERM=dumb set, rich and click skip ANSI escape
+    generation entirely, so tests can assert on result.stdout directly,
+    and a wide fixed COLUMNS stops click from wrapping help text
+    mid-option-name.
+    """
+    monkeypatch.setenv("NO_COLOR", "1")
+    monkeypatch.setenv("TERM", "dumb")
+    monkeypatch.setenv("COLUMNS", "200")
+
+
+COMMITTED_SAMPLE = Path(__file__).parent / "assets" / "sample.mp4"
+
+
+def pytest_configure(config):
+    """Put tmp_path on the RAM-backed /dev/shm when available.
+
+    Every generated asset and output clip then lives in memory instead of
+    hitting the disk writeback path. An explicit --basetemp (including the
+    one xdist passes to its workers) always wins.
+    """
+    if config.option.basetemp is None:
+        shm = Path("/dev/shm")
+        if shm.is_dir() and os.access(shm, os.W_OK):
+            config.option.basetemp = shm / f"pytest-vidio-{os.getuid()}"
+
+
+def shared_asset_dir(tmp_path_factory) -> Path:
+    """
+    Return a temp directory shared by all xdist workers in one run.
+
+    Under xdist each worker's basetemp is <base>/popen-gwN, so one level
+    up is common to the whole session; without xdist it is the session
+    basetemp itself.
+    """
+    base = tmp_path_factory.getbasetemp()
+    if base.name.startswith("popen-"):
+        base = base.parent
+    shared = base / "shared"
+    shared.mkdir(exist_ok=True)
+    return shared
+
+
+def publish_shared_asset(target: Path, build) -> bool:
+    """
+    Build an asset into the worker-shared dir, tolerating racing workers.
+
+    `build` writes to a worker-unique temp path; the result is published
+    with an atomic os.replace, so concurrent workers building the same
+    deterministic asset simply overwrite each other with identical bytes
+    and no locking is needed.
+
+    Returns:
+        bool: True if the target exists afterwards.
+    """
+    if target.exists():
+        return True
+    scratch = target.with_name(f".{os.getpid()}-{target.name}")
+    try:
+        if not build(scratch):
+            return False
+        os.replace(scratch, target)
+    finally:
+        scratch.unlink(missing_ok=True)
+    return target.exists()
+
+
+@pytest.fixture(scope="session")
+def sample_video(tmp_path_factory):
+    """
+    Return a short generated test clip, synthesized once per run.
+
+    The tests only assert exit codes and output existence, so a 5-second
+    640x360 clip at 10 fps (50 frames) exercises the same code paths as a
+    full-length asset while keeping every encode near the ffmpeg process
+    startup floor. The clip lives in the worker-shared temp dir so xdist
+    workers reuse one file. Falls back to the committed sample.mp4 when
+    ffmpeg is unavailable or generation fails.
+    """
+    import subprocess
+
+    from vidio_cli.ffmpeg_utils import check_ffmpeg
+
+    if not check_ffmpeg():
+        return COMMITTED_SAMPLE
+
+    def build(scratch: Path) -> bool:
+        command = [
+            "ffmpeg",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=red:s=640x360:d=5:r=10",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-pix_fmt",
+            "yuv420p",
+            "-f",
+            "mp4",
+            "-y",
+            str(scratch),
+        ]
+        return subprocess.run(command, capture_output=True).returncode == 0
+
+    sample = shared_asset_dir(tmp_path_factory) / "sample.mp4"
+    if not publish_shared_asset(sample, build):
+        return COMMITTED_SAMPLE
+    return sample
+
+
+@pytest.fixture(autouse=True, scope="session")
+def probed_sample(sample_video):
+    """
+    Warm the probe cache for the shared sample video once per session.
+
+    The commands read probes through get_cached_video_info, so pre-probing
+    here means the dozens of CLI invocations against the sample hit the
+    in-process memo instead of each spawning ffprobe.
+    """
+    from vidio_cli.ffmpeg_utils import check_ffprobe, get_cached_video_info
+
+    if check_ffprobe() and sample_video.exists():
+        try:
+            get_cached_video_info(sample_video)
+        except Exception:
+            # A failing probe is each test's own concern
+            pass
+    yield
@@ -1,33 +1,15 @@
 """Tests for the concat command."""
 
-import tempfile
-from pathlib import Path
-
-import pytest
 from typer.testing import CliRunner
 
 from vidio_cli.cli import app
-from vidio_cli.ffmpeg_utils import check_ffmpeg
+from _ffmpeg_guard import requires_ffmpeg
 
 # Integration tests require ffmpeg and real media assets.
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(not check_ffmpeg(), reason="ffmpeg is not available"),
-]
+pytestmark = requires_ffmpeg
 
 runner = CliRunner()
 
-# Replace this with actual test video paths
-ASSET_DIR = Path(__file__).parent / "assets"
-TEST_VIDEO1 = ASSET_DIR / "sample.mp4"
-
-
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary directory for test outputs."""
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
 
 def test_concat_help():
     """Test that the concat command help works."""
@@ -36,30 +18,36 @@ def test_concat_help():
     assert "Concatenate multiple videos" in result.stdout
 
 
-def test_concat_horizontal(temp_output_dir):
+def test_concat_horizontal(sample_video, tmp_path):
     """Test the concat command with horizontal layout."""
-    output_file = temp_output_dir / "output.mp4"
+    output_file = tmp_path / "output.mp4"
 
     # Run the command
     result = runner.invoke(
-        app, ["concat", str(TEST_VIDEO1), str(TEST_VIDEO1), str(output_file)]
+        app, ["concat", str(sample_video), str(sample_video), str(output_file)]
     )
 
     # Check that it succeeded
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_concat_vertical(temp_output_dir):
+def test_concat_vertical(sample_video, tmp_path):
     """Test the concat command with vertical layout."""
-    output_file = temp_output_dir / "output.mp4"
+    output_file = tmp_path / "output.mp4"
 
     # Run the command
     result = runner.invoke(
         app,
-        ["concat", str(TEST_VIDEO1), str(TEST_VIDEO1), str(output_file), "--vertical"],
+        [
+            "concat",
+            str(sample_video),
+            str(sample_video),
+            str(output_file),
+            "--vertical",
+        ],
     )
 
     # Check that it succeeded
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
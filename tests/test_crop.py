@@ -1,51 +1,32 @@
 """Tests for the crop command."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 from typer.testing import CliRunner
 
 from vidio_cli.cli import app
-from vidio_cli.ffmpeg_utils import check_ffmpeg
+from _ffmpeg_guard import requires_ffmpeg
 
 runner = CliRunner()
 
 # Integration tests require ffmpeg and real media assets.
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(not check_ffmpeg(), reason="ffmpeg is not available"),
-]
+pytestmark = requires_ffmpeg
 
 
 @pytest.fixture
-def sample_video():
-    """Return the path to the sample video."""
-    return Path(__file__).parent / "assets" / "sample.mp4"
+def temp_output(tmp_path):
+    """Return a temporary output file path (file doesn't exist yet)."""
+    return tmp_path / "out.mp4"
 
 
-@pytest.fixture
-def temp_output():
-    """Create a temporary output file path (file doesn't exist yet)."""
-    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=True) as f:
-        output_path = Path(f.name)
-    # File is deleted after context manager, so we just have the path
-    yield output_path
-    # Cleanup
-    if output_path.exists():
-        output_path.unlink()
-
-
-def test_crop_help(clean_output):
+def test_crop_help():
     """Test that the crop command shows help."""
     result = runner.invoke(app, ["crop", "--help"])
-    help_text = clean_output(result.stdout)
     assert result.exit_code == 0
-    assert "Crop a video to a specific region" in help_text
+    assert "Crop a video to a specific region" in result.stdout
     # Typer/Click help rendering differs by runtime; accept short or long flags.
-    assert "--width" in help_text or "-w" in help_text
-    assert "--height" in help_text or "-h" in help_text
-    assert "--preset" in help_text
+    assert "--width" in result.stdout or "-w" in result.stdout
+    assert "--height" in result.stdout or "-h" in result.stdout
+    assert "--preset" in result.stdout
 
 
 def test_crop_no_args():
@@ -66,62 +47,19 @@ def test_crop_missing_dimensions(sample_video, temp_output):
     assert "Must specify --width and --height, or use --preset" in result.stdout
 
 
-def test_crop_with_preset_center_square(sample_video, temp_output):
-    """Test cropping with center-square preset."""
+@pytest.mark.parametrize("preset", ["center-square", "16:9", "9:16", "4:3", "1:1"])
+def test_crop_with_preset(preset, sample_video, temp_output):
+    """Test cropping with each supported preset."""
     result = runner.invoke(
         app,
-        ["crop", str(sample_video), str(temp_output), "--preset", "center-square"],
+        ["crop", str(sample_video), str(temp_output), "--preset", preset],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
-    assert "Using preset: center-square" in result.stdout
+    assert temp_output.stat().st_size > 0
+    assert f"Using preset: {preset}" in result.stdout
     assert "Cropped video saved" in result.stdout
 
 
-def test_crop_with_preset_16_9(sample_video, temp_output):
-    """Test cropping with 16:9 preset."""
-    result = runner.invoke(
-        app,
-        ["crop", str(sample_video), str(temp_output), "--preset", "16:9"],
-    )
-    assert result.exit_code == 0
-    assert temp_output.exists()
-    assert "Using preset: 16:9" in result.stdout
-
-
-def test_crop_with_preset_9_16(sample_video, temp_output):
-    """Test cropping with 9:16 preset."""
-    result = runner.invoke(
-        app,
-        ["crop", str(sample_video), str(temp_output), "--preset", "9:16"],
-    )
-    assert result.exit_code == 0
-    assert temp_output.exists()
-    assert "Using preset: 9:16" in result.stdout
-
-
-def test_crop_with_preset_4_3(sample_video, temp_output):
-    """Test cropping with 4:3 preset."""
-    result = runner.invoke(
-        app,
-        ["crop", str(sample_video), str(temp_output), "--preset", "4:3"],
-    )
-    assert result.exit_code == 0
-    assert temp_output.exists()
-    assert "Using preset: 4:3" in result.stdout
-
-
-def test_crop_with_preset_1_1(sample_video, temp_output):
-    """Test cropping with 1:1 preset."""
-    result = runner.invoke(
-        app,
-        ["crop", str(sample_video), str(temp_output), "--preset", "1:1"],
-    )
-    assert result.exit_code == 0
-    assert temp_output.exists()
-    assert "Using preset: 1:1" in result.stdout
-
-
 def test_crop_with_invalid_preset(sample_video, temp_output):
     """Test cropping with invalid preset."""
     result = runner.invoke(
@@ -148,7 +86,7 @@ def test_crop_with_manual_dimensions(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
     assert "Cropping to 320x240" in result.stdout
 
 
@@ -172,7 +110,7 @@ def test_crop_with_manual_dimensions_and_offsets(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
     assert "Cropping to 400x200 at position (100, 50)" in result.stdout
 
 
@@ -235,7 +173,7 @@ def test_crop_overwrite_existing_file(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
 def test_crop_without_overwrite_existing_file(sample_video, temp_output):
@@ -288,7 +226,7 @@ def test_crop_verbose_mode(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
 def test_crop_preset_overrides_manual_params(sample_video, temp_output):
@@ -308,7 +246,7 @@ def test_crop_preset_overrides_manual_params(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
     assert "ignoring manual crop parameters" in result.stdout
 
 
@@ -328,7 +266,7 @@ def test_crop_even_dimensions_adjustment(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
     # Should show adjustment messages
     assert "Adjusted" in result.stdout or "320x240" in result.stdout
 
@@ -336,8 +274,17 @@ def test_crop_even_dimensions_adjustment(sample_video, temp_output):
 # Edge case tests
 
 
-def test_crop_width_exceeds_video(sample_video, temp_output):
-    """Test that crop fails when width exceeds video width."""
+@pytest.mark.parametrize(
+    "width,height,message",
+    [
+        ("1000", "200", "exceeds video width"),
+        ("200", "1000", "exceeds video height"),
+    ],
+)
+def test_crop_dimension_exceeds_video(
+    width, height, message, sample_video, temp_output
+):
+    """Test that crop fails when either dimension exceeds the video."""
     result = runner.invoke(
         app,
         [
@@ -345,9 +292,9 @@ def test_crop_width_exceeds_video(sample_video, temp_output):
             str(sample_video),
             str(temp_output),
             "--width",
-            "1000",
+            width,
             "--height",
-            "200",
+            height,
             "--x",
             "0",
             "--y",
@@ -355,29 +302,7 @@ def test_crop_width_exceeds_video(sample_video, temp_output):
         ],
     )
     assert result.exit_code != 0
-    assert "exceeds video width" in result.stdout
-
-
-def test_crop_height_exceeds_video(sample_video, temp_output):
-    """Test that crop fails when height exceeds video height."""
-    result = runner.invoke(
-        app,
-        [
-            "crop",
-            str(sample_video),
-            str(temp_output),
-            "--width",
-            "200",
-            "--height",
-            "1000",
-            "--x",
-            "0",
-            "--y",
-            "0",
-        ],
-    )
-    assert result.exit_code != 0
-    assert "exceeds video height" in result.stdout
+    assert message in result.stdout
 
 
 def test_crop_offset_causes_overflow(sample_video, temp_output):
@@ -417,7 +342,7 @@ def test_crop_very_small_dimensions(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
     assert "Warning" in result.stdout
     assert "small crop dimensions" in result.stdout
 
@@ -441,7 +366,7 @@ def test_crop_minimum_dimensions(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
 def test_crop_full_video_dimensions(sample_video, temp_output):
@@ -463,7 +388,7 @@ def test_crop_full_video_dimensions(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
 def test_crop_offset_at_edge(sample_video, temp_output):
@@ -486,7 +411,7 @@ def test_crop_offset_at_edge(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
 def test_crop_single_pixel_beyond_edge(sample_video, temp_output):
@@ -525,11 +450,12 @@ def test_crop_preset_on_already_correct_aspect(sample_video, temp_output):
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
-def test_crop_with_zero_width(sample_video, temp_output):
-    """Test that crop fails with zero width."""
+@pytest.mark.parametrize("width,height", [("0", "100"), ("100", "0")])
+def test_crop_with_zero_dimension(width, height, sample_video, temp_output):
+    """Test that crop fails when either dimension is zero."""
     result = runner.invoke(
         app,
         [
@@ -537,51 +463,18 @@ def test_crop_with_zero_width(sample_video, temp_output):
             str(sample_video),
             str(temp_output),
             "--width",
-            "0",
+            width,
             "--height",
-            "100",
+            height,
         ],
     )
     # Should fail at validation
     assert result.exit_code != 0
 
 
-def test_crop_with_zero_height(sample_video, temp_output):
-    """Test that crop fails with zero height."""
-    result = runner.invoke(
-        app,
-        [
-            "crop",
-            str(sample_video),
-            str(temp_output),
-            "--width",
-            "100",
-            "--height",
-            "0",
-        ],
-    )
-    # Should fail at validation
-    assert result.exit_code != 0
-
-
-def test_crop_case_insensitive_preset(sample_video, temp_output):
-    """Test that presets are case-insensitive."""
-    result = runner.invoke(
-        app,
-        [
-            "crop",
-            str(sample_video),
-            str(temp_output),
-            "--preset",
-            "CENTER-SQUARE",
-        ],
-    )
-    assert result.exit_code == 0
-    assert temp_output.exists()
-
-
-def test_crop_mixed_case_preset(sample_video, temp_output):
-    """Test preset with mixed case."""
+@pytest.mark.parametrize("preset", ["CENTER-SQUARE", "Center-Square"])
+def test_crop_case_insensitive_preset(preset, sample_video, temp_output):
+    """Test that presets accept any casing."""
     result = runner.invoke(
         app,
         [
@@ -589,11 +482,11 @@ def test_crop_mixed_case_preset(sample_video, temp_output):
             str(sample_video),
             str(temp_output),
             "--preset",
-            "Center-Square",
+            preset,
         ],
     )
     assert result.exit_code == 0
-    assert temp_output.exists()
+    assert temp_output.stat().st_size > 0
 
 
 def test_crop_with_only_width_specified(sample_video, temp_output):
@@ -1,26 +1,18 @@
 """Tests for the info command."""
 
 import json
-from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
 from vidio_cli.cli import app
-from vidio_cli.ffmpeg_utils import check_ffmpeg
+from _ffmpeg_guard import requires_ffmpeg
 
 # Integration tests require ffmpeg and real media assets.
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(not check_ffmpeg(), reason="ffmpeg is not available"),
-]
+pytestmark = requires_ffmpeg
 
 runner = CliRunner()
 
-# Replace this with actual test video path
-ASSET_DIR = Path(__file__).parent / "assets"
-TEST_VIDEO = ASSET_DIR / "sample.mp4"
-
 
 def test_info_help():
     """Test that the info command help works."""
@@ -29,9 +21,9 @@ def test_info_help():
     assert "Display detailed information about a video file" in result.stdout
 
 
-def test_info_basic():
+def test_info_basic(sample_video):
     """Test the info command with basic output."""
-    result = runner.invoke(app, ["info", str(TEST_VIDEO)])
+    result = runner.invoke(app, ["info", str(sample_video)])
 
     # Check that it succeeded
     assert result.exit_code == 0
@@ -40,9 +32,9 @@ def test_info_basic():
     assert "Resolution" in result.stdout
 
 
-def test_info_json():
+def test_info_json(sample_video):
     """Test the info command with JSON output."""
-    result = runner.invoke(app, ["info", str(TEST_VIDEO), "--json"])
+    result = runner.invoke(app, ["info", str(sample_video), "--json"])
 
     # Check that it succeeded
     assert result.exit_code == 0
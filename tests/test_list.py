@@ -1,26 +1,25 @@
 """Tests for the list command."""
 
 import json
-import tempfile
-from pathlib import Path
+import shutil
 
 import pytest
 from typer.testing import CliRunner
 
 from vidio_cli.cli import app
-from vidio_cli.ffmpeg_utils import check_ffmpeg
+from _ffmpeg_guard import requires_ffmpeg
 
 # Integration tests require ffmpeg and real media assets.
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(not check_ffmpeg(), reason="ffmpeg is not available"),
-]
+pytestmark = requires_ffmpeg
 
 runner = CliRunner()
 
-# Test video path
-ASSET_DIR = Path(__file__).parent / "assets"
-TEST_VIDEO = ASSET_DIR / "sample.mp4"
+
+@pytest.fixture
+def video_dir(sample_video, tmp_path):
+    """A directory containing just the generated sample clip."""
+    shutil.copy(sample_video, tmp_path / "sample.mp4")
+    return tmp_path
 
 
 def test_list_help():
@@ -30,33 +29,32 @@ def test_list_help():
     assert "List all video files" in result.stdout
 
 
-def test_list_empty_directory():
+def test_list_empty_directory(tmp_path):
     """Test listing videos in an empty directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        result = runner.invoke(app, ["list", tmpdir])
-        assert result.exit_code == 0
-        assert "No video files found" in result.stdout
+    result = runner.invoke(app, ["list", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "No video files found" in result.stdout
 
 
-def test_list_with_videos():
+def test_list_with_videos(video_dir):
     """Test listing videos in directory with video files."""
-    result = runner.invoke(app, ["list", str(ASSET_DIR)])
+    result = runner.invoke(app, ["list", str(video_dir)])
     assert result.exit_code == 0
     assert "sample.mp4" in result.stdout
     assert "Found 1 video file(s)" in result.stdout
 
 
-def test_ls_alias():
+def test_ls_alias(video_dir):
     """Test that ls alias works the same as list."""
-    result = runner.invoke(app, ["ls", str(ASSET_DIR)])
+    result = runner.invoke(app, ["ls", str(video_dir)])
     assert result.exit_code == 0
     assert "sample.mp4" in result.stdout
     assert "Found 1 video file(s)" in result.stdout
 
 
-def test_list_detailed():
+def test_list_detailed(video_dir):
     """Test listing videos with detailed information using -l flag."""
-    result = runner.invoke(app, ["list", str(ASSET_DIR), "-l"])
+    result = runner.invoke(app, ["list", str(video_dir), "-l"])
     assert result.exit_code == 0
     assert "sample.mp4" in result.stdout
     # In ls-style format, these appear as data, not headers
@@ -65,9 +63,9 @@ def test_list_detailed():
     assert "h264" in result.stdout  # Codec
 
 
-def test_list_detailed_long_form():
+def test_list_detailed_long_form(video_dir):
     """Test listing videos with detailed information using --list flag."""
-    result = runner.invoke(app, ["list", str(ASSET_DIR), "--list"])
+    result = runner.invoke(app, ["list", str(video_dir), "--list"])
     assert result.exit_code == 0
     assert "sample.mp4" in result.stdout
     # In ls-style format, these appear as data, not headers
@@ -76,9 +74,9 @@ def test_list_detailed_long_form():
     assert "h264" in result.stdout  # Codec
 
 
-def test_list_table_format():
+def test_list_table_format(video_dir):
     """Test table format output."""
-    result = runner.invoke(app, ["list", str(ASSET_DIR), "--table", "-l"])
+    result = runner.invoke(app, ["list", str(video_dir), "--table", "-l"])
     assert result.exit_code == 0
     assert "sample.mp4" in result.stdout
     # In table format, these appear as headers
@@ -87,16 +85,16 @@ def test_list_table_format():
     assert "Codec" in result.stdout
 
 
-def test_list_json_output():
+def test_list_json_output(video_dir):
     """Test JSON output format."""
-    result = runner.invoke(app, ["list", str(ASSET_DIR), "--json"])
+    result = runner.invoke(app, ["list", str(video_dir), "--json"])
     assert result.exit_code == 0
-    
+
     # Parse JSON output
     output_data = json.loads(result.stdout)
     assert isinstance(output_data, list)
     assert len(output_data) == 1
-    
+
     video_info = output_data[0]
     assert video_info["name"] == "sample.mp4"
     assert "size_bytes" in video_info
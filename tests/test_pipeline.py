@@ -0,0 +1,67 @@
+"""Tests for the pipeline command."""
+
+from typer.testing import CliRunner
+
+from vidio_cli.cli import app
+from _ffmpeg_guard import requires_ffmpeg
+
+# Integration tests require ffmpeg and real media assets.
+pytestmark = requires_ffmpeg
+
+runner = CliRunner()
+
+
+def test_pipeline_help():
+    """Test that the pipeline command help works."""
+    result = runner.invoke(app, ["pipeline", "--help"])
+    assert result.exit_code == 0
+    assert "Crop multiple videos and stack them" in result.stdout
+
+
+def test_pipeline_horizontal(sample_video, tmp_path):
+    """Test cropping and stacking two videos horizontally."""
+    output_file = tmp_path / "output.mp4"
+
+    # Run the command (sample video is 640x360)
+    result = runner.invoke(
+        app,
+        [
+            "pipeline",
+            str(sample_video),
+            str(sample_video),
+            str(output_file),
+            "--width",
+            "320",
+            "--height",
+            "240",
+        ],
+    )
+
+    # Check that it succeeded
+    assert result.exit_code == 0
+    assert output_file.stat().st_size > 0
+
+
+def test_pipeline_vertical(sample_video, tmp_path):
+    """Test cropping and stacking two videos vertically."""
+    output_file = tmp_path / "output.mp4"
+
+    # Run the command
+    result = runner.invoke(
+        app,
+        [
+            "pipeline",
+            str(sample_video),
+            str(sample_video),
+            str(output_file),
+            "--width",
+            "320",
+            "--height",
+            "240",
+            "--vertical",
+        ],
+    )
+
+    # Check that it succeeded
+    assert result.exit_code == 0
+    assert output_file.stat().st_size > 0
@@ -1,33 +1,15 @@
 """Tests for the resize command."""
 
-import tempfile
-from pathlib import Path
-
-import pytest
 from typer.testing import CliRunner
 
 from vidio_cli.cli import app
-from vidio_cli.ffmpeg_utils import check_ffmpeg
+from _ffmpeg_guard import requires_ffmpeg
 
 # Integration tests require ffmpeg and real media assets.
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(not check_ffmpeg(), reason="ffmpeg is not available"),
-]
+pytestmark = requires_ffmpeg
 
 runner = CliRunner()
 
-# Test video path
-ASSET_DIR = Path(__file__).parent / "assets"
-TEST_VIDEO = ASSET_DIR / "sample.mp4"
-
-
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary directory for test outputs."""
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
 
 def test_resize_help():
     """Test that the resize command help works."""
@@ -36,110 +18,129 @@ def test_resize_help():
     assert "Resize a video to new dimensions" in result.stdout
 
 
-def test_resize_with_width_and_height(temp_output_dir):
+def test_resize_with_width_and_height(sample_video, tmp_path):
     """Test resizing with specific width and height."""
-    output_file = temp_output_dir / "resized.mp4"
+    output_file = tmp_path / "resized.mp4"
 
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), str(output_file), "--width", "320", "--height", "240"]
+        app,
+        [
+            "resize",
+            str(sample_video),
+            str(output_file),
+            "--width",
+            "320",
+            "--height",
+            "240",
+        ],
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_resize_with_scale(temp_output_dir):
+def test_resize_with_scale(sample_video, tmp_path):
     """Test resizing with scale factor."""
-    output_file = temp_output_dir / "resized.mp4"
+    output_file = tmp_path / "resized.mp4"
 
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), str(output_file), "--scale", "0.5"]
+        app, ["resize", str(sample_video), str(output_file), "--scale", "0.5"]
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_resize_width_only(temp_output_dir):
+def test_resize_width_only(sample_video, tmp_path):
     """Test resizing with width only (maintain aspect ratio)."""
-    output_file = temp_output_dir / "resized.mp4"
+    output_file = tmp_path / "resized.mp4"
 
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), str(output_file), "--width", "320"]
+        app, ["resize", str(sample_video), str(output_file), "--width", "320"]
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_resize_height_only(temp_output_dir):
+def test_resize_height_only(sample_video, tmp_path):
     """Test resizing with height only (maintain aspect ratio)."""
-    output_file = temp_output_dir / "resized.mp4"
+    output_file = tmp_path / "resized.mp4"
 
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), str(output_file), "--height", "240"]
+        app, ["resize", str(sample_video), str(output_file), "--height", "240"]
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_resize_force_aspect(temp_output_dir):
+def test_resize_force_aspect(sample_video, tmp_path):
     """Test resizing with forced aspect ratio."""
-    output_file = temp_output_dir / "resized.mp4"
+    output_file = tmp_path / "resized.mp4"
 
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), str(output_file), "--width", "100", "--height", "300", "--force-aspect"]
+        app,
+        [
+            "resize",
+            str(sample_video),
+            str(output_file),
+            "--width",
+            "100",
+            "--height",
+            "300",
+            "--force-aspect",
+        ],
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
     assert "may distort" in result.stdout
 
 
-def test_resize_no_parameters():
+def test_resize_no_parameters(sample_video):
     """Test that resize fails without any size parameters."""
-    result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), "output.mp4"]
-    )
+    result = runner.invoke(app, ["resize", str(sample_video), "output.mp4"])
 
     assert result.exit_code != 0
     assert "Must specify at least one" in result.stdout
 
 
-def test_resize_conflicting_parameters():
+def test_resize_conflicting_parameters(sample_video):
     """Test that scale conflicts with width/height."""
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), "output.mp4", "--scale", "0.5", "--width", "320"]
+        app,
+        ["resize", str(sample_video), "output.mp4", "--scale", "0.5", "--width", "320"],
     )
 
     assert result.exit_code != 0
 
 
-def test_resize_invalid_scale():
+def test_resize_invalid_scale(sample_video):
     """Test invalid scale values."""
     # Test negative scale
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), "output.mp4", "--scale", "-1"]
+        app, ["resize", str(sample_video), "output.mp4", "--scale", "-1"]
     )
     assert result.exit_code != 0
 
-    # Test zero scale  
+    # Test zero scale
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), "output.mp4", "--scale", "0"]
+        app, ["resize", str(sample_video), "output.mp4", "--scale", "0"]
     )
     assert result.exit_code != 0
 
 
-def test_resize_overwrite_protection(temp_output_dir):
+def test_resize_overwrite_protection(sample_video, tmp_path):
     """Test that existing files are protected unless --overwrite is used."""
-    output_file = temp_output_dir / "existing.mp4"
-    output_file.write_text("existing file")
+    output_file = tmp_path / "existing.mp4"
+    output_file.touch()
 
     # Should fail without --overwrite
     result = runner.invoke(
-        app, ["resize", str(TEST_VIDEO), str(output_file), "--width", "320"],
-        input="n\n"  # Answer "no" to overwrite prompt
+        app,
+        ["resize", str(sample_video), str(output_file), "--width", "320"],
+        input="n\n",  # Answer "no" to overwrite prompt
     )
 
     assert result.exit_code == 0
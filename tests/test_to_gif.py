@@ -1,191 +1,313 @@
 """Tests for the to-gif command."""
 
-import tempfile
-from pathlib import Path
+import subprocess
 
 import pytest
 from typer.testing import CliRunner
 
 from vidio_cli.cli import app
-from vidio_cli.ffmpeg_utils import check_ffmpeg
+from _ffmpeg_guard import requires_ffmpeg
 
 # Integration tests require ffmpeg and real media assets.
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(not check_ffmpeg(), reason="ffmpeg is not available"),
-]
+pytestmark = requires_ffmpeg
 
 runner = CliRunner()
 
-# Test video path
-ASSET_DIR = Path(__file__).parent / "assets"
-TEST_VIDEO = ASSET_DIR / "sample.mp4"
-
-
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary directory for test outputs."""
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
 
 def test_to_gif_help():
     """Test that the to-gif command help works."""
     result = runner.invoke(app, ["to-gif", "--help"])
     assert result.exit_code == 0
-    assert "Convert a video to high-quality GIF" in result.stdout
+    assert "Convert one or more videos to high-quality GIF format" in result.stdout
 
 
-def test_to_gif_basic(temp_output_dir):
+def test_to_gif_basic(sample_video, tmp_path):
     """Test basic GIF conversion."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
-    result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file)]
-    )
+    result = runner.invoke(app, ["to-gif", str(sample_video), str(output_file)])
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
     assert "GIF created" in result.stdout
 
 
-def test_to_gif_with_fps(temp_output_dir):
+def test_to_gif_with_fps(sample_video, tmp_path):
     """Test GIF conversion with custom FPS."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--fps", "5"]
+        app, ["to-gif", str(sample_video), str(output_file), "--fps", "5"]
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
+
+
+@pytest.fixture(scope="module")
+def sample_320p(sample_video, tmp_path_factory):
+    """Pre-scale the sample once for the tests that re-scale anyway."""
+    from conftest import publish_shared_asset, shared_asset_dir
+
+    def build(scratch):
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-t",
+                "2",
+                "-i",
+                str(sample_video),
+                "-vf",
+                "scale=320:-2",
+                "-c:v",
+                "libx264",
+                "-preset",
+                "ultrafast",
+                "-f",
+                "mp4",
+                "-y",
+                str(scratch),
+            ],
+            capture_output=True,
+        )
+        return result.returncode == 0
 
+    scaled = shared_asset_dir(tmp_path_factory) / "sample_320p.mp4"
+    assert publish_shared_asset(scaled, build), "pre-scaled sample generation failed"
+    return scaled
 
-def test_to_gif_with_scale(temp_output_dir):
+
+def test_to_gif_with_scale(sample_320p, tmp_path):
     """Test GIF conversion with scaling."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--scale", "0.5"]
+        app, ["to-gif", str(sample_320p), str(output_file), "--scale", "0.5"]
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_to_gif_with_width(temp_output_dir):
+def test_to_gif_with_width(sample_320p, tmp_path):
     """Test GIF conversion with custom width."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--width", "320"]
+        app, ["to-gif", str(sample_320p), str(output_file), "--width", "320"]
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_to_gif_with_time_range(temp_output_dir):
+def test_to_gif_with_time_range(sample_video, tmp_path):
     """Test GIF conversion with time range."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--start", "1", "--duration", "3"]
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--start",
+            "1",
+            "--duration",
+            "3",
+        ],
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
+
+
+@pytest.fixture(scope="module")
+def shared_palette(sample_video, tmp_path_factory):
+    """Generate one palette PNG for the sample clip, shared across workers."""
+    from conftest import publish_shared_asset, shared_asset_dir
+
+    def build(scratch):
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-t",
+                "2",
+                "-i",
+                str(sample_video),
+                "-vf",
+                "fps=10,palettegen",
+                "-f",
+                "image2",
+                "-y",
+                str(scratch),
+            ],
+            capture_output=True,
+        )
+        return result.returncode == 0
 
+    palette = shared_asset_dir(tmp_path_factory) / "palette.png"
+    assert publish_shared_asset(palette, build), "palette generation failed"
+    return palette
 
-def test_to_gif_quality_levels(temp_output_dir):
-    """Test different quality levels."""
-    for quality in ["low", "medium", "high"]:
-        output_file = temp_output_dir / f"output_{quality}.gif"
-        
-        result = runner.invoke(
-            app, ["to-gif", str(TEST_VIDEO), str(output_file), "--quality", quality, "--duration", "2"]
-        )
-        
-        assert result.exit_code == 0
-        assert output_file.exists()
+
+@pytest.mark.parametrize("quality", ["low", "medium", "high"])
+def test_to_gif_quality_levels(quality, sample_video, shared_palette, tmp_path):
+    """Test different quality levels against one shared palette."""
+    output_file = tmp_path / f"output_{quality}.gif"
+
+    result = runner.invoke(
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--quality",
+            quality,
+            "--duration",
+            "2",
+            "--palette",
+            str(shared_palette),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert output_file.stat().st_size > 0
 
 
-def test_to_gif_quality_numeric(temp_output_dir):
+def test_to_gif_quality_numeric(sample_video, tmp_path):
     """Test numeric quality levels."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--quality", "8", "--duration", "2"]
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--quality",
+            "8",
+            "--duration",
+            "2",
+        ],
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
 
 
-def test_to_gif_no_optimize(temp_output_dir):
+def test_to_gif_mpdecimate(sample_video, tmp_path):
+    """Test GIF conversion with duplicate-frame dropping."""
+    output_file = tmp_path / "output.gif"
+
+    result = runner.invoke(
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--mpdecimate",
+            "--duration",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert output_file.stat().st_size > 0
+
+
+def test_to_gif_no_optimize(sample_video, tmp_path):
     """Test GIF conversion without palette optimization."""
-    output_file = temp_output_dir / "output.gif"
+    output_file = tmp_path / "output.gif"
 
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--no-optimize", "--duration", "2"]
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--no-optimize",
+            "--duration",
+            "2",
+        ],
     )
 
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
     assert "Skipping palette optimization" in result.stdout
 
 
-def test_to_gif_dithering_options(temp_output_dir):
-    """Test different dithering algorithms."""
-    for dither in ["none", "bayer", "floyd_steinberg"]:
-        output_file = temp_output_dir / f"output_{dither}.gif"
-        
-        result = runner.invoke(
-            app, ["to-gif", str(TEST_VIDEO), str(output_file), "--dither", dither, "--duration", "2"]
-        )
-        
-        assert result.exit_code == 0
-        assert output_file.exists()
+@pytest.mark.parametrize("dither", ["none", "bayer", "floyd_steinberg"])
+def test_to_gif_dithering_options(dither, sample_video, shared_palette, tmp_path):
+    """Test different dithering algorithms against one shared palette."""
+    output_file = tmp_path / f"output_{dither}.gif"
 
+    result = runner.invoke(
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--dither",
+            dither,
+            "--duration",
+            "2",
+            "--palette",
+            str(shared_palette),
+        ],
+    )
 
-def test_to_gif_conflicting_time_options():
+    assert result.exit_code == 0
+    assert output_file.stat().st_size > 0
+
+
+def test_to_gif_conflicting_time_options(sample_video):
     """Test that specifying both --end and --duration fails."""
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), "output.gif", "--end", "10", "--duration", "5"]
+        app,
+        ["to-gif", str(sample_video), "output.gif", "--end", "10", "--duration", "5"],
     )
 
     assert result.exit_code == 1
     assert "Cannot specify both --end and --duration" in result.stdout
 
 
-def test_to_gif_conflicting_size_options():
+def test_to_gif_conflicting_size_options(sample_video):
     """Test that specifying both --scale and --width fails."""
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), "output.gif", "--scale", "0.5", "--width", "320"]
+        app,
+        ["to-gif", str(sample_video), "output.gif", "--scale", "0.5", "--width", "320"],
     )
 
     assert result.exit_code == 1
     assert "Cannot specify both --scale and --width" in result.stdout
 
 
-def test_to_gif_invalid_quality():
+def test_to_gif_invalid_quality(sample_video):
     """Test invalid quality values."""
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), "output.gif", "--quality", "invalid"]
+        app, ["to-gif", str(sample_video), "output.gif", "--quality", "invalid"]
     )
-    
+
     assert result.exit_code != 0
 
 
-def test_to_gif_overwrite_protection(temp_output_dir):
+def test_to_gif_overwrite_protection(sample_video, tmp_path):
     """Test that existing files are protected unless --overwrite is used."""
-    output_file = temp_output_dir / "existing.gif"
-    output_file.write_text("existing file")
+    output_file = tmp_path / "existing.gif"
+    output_file.touch()
 
-    # Should fail without --overwrite
+    # Should abort without --overwrite; --no-clobber answers for us
     result = runner.invoke(
-        app, ["to-gif", str(TEST_VIDEO), str(output_file), "--duration", "1"],
-        input="n\n"  # Answer "no" to overwrite prompt
+        app,
+        [
+            "to-gif",
+            str(sample_video),
+            str(output_file),
+            "--duration",
+            "1",
+            "--no-clobber",
+        ],
     )
 
     assert result.exit_code == 0
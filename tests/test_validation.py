@@ -0,0 +1,162 @@
+"""Direct unit tests for the pure helper functions.
+
+These call validation and filter-construction helpers straight from the
+command modules, skipping Typer's argument parsing and any ffmpeg/ffprobe
+spawns, so they run everywhere and in microseconds. `pytest -m unit`
+selects just these for a sub-second pre-commit check.
+"""
+
+import pytest
+import typer
+
+from vidio_cli.commands.crop import parse_preset, validate_crop_params
+from vidio_cli.commands.grid import calculate_grid_size
+from vidio_cli.commands.pipeline import build_pipeline_filter
+from vidio_cli.ffmpeg_utils import parse_time
+
+pytestmark = pytest.mark.unit
+
+
+def assert_validation_error(fn, *args, match=None):
+    """Assert that a validation helper rejects its arguments."""
+    with pytest.raises(typer.BadParameter, match=match):
+        fn(*args)
+
+
+# validate_crop_params(width, height, x, y, original_width, original_height)
+
+
+def test_validate_crop_params_accepts_valid_region():
+    validate_crop_params(320, 240, 0, 0, 640, 360)
+
+
+def test_validate_crop_params_rejects_zero_width():
+    assert_validation_error(
+        validate_crop_params, 0, 240, 0, 0, 640, 360, match="must be positive"
+    )
+
+
+def test_validate_crop_params_rejects_zero_height():
+    assert_validation_error(
+        validate_crop_params, 320, 0, 0, 0, 640, 360, match="must be positive"
+    )
+
+
+def test_validate_crop_params_rejects_negative_offset():
+    assert_validation_error(
+        validate_crop_params, 320, 240, -10, 0, 640, 360, match="non-negative"
+    )
+
+
+def test_validate_crop_params_rejects_width_overflow():
+    assert_validation_error(
+        validate_crop_params, 400, 200, 300, 0, 640, 360, match="exceeds video width"
+    )
+
+
+def test_validate_crop_params_rejects_height_overflow():
+    assert_validation_error(
+        validate_crop_params, 200, 200, 0, 300, 640, 360, match="exceeds video height"
+    )
+
+
+def test_validate_crop_params_accepts_region_at_edge():
+    # 540 + 100 = 640 and 260 + 100 = 360: exactly at the edge is valid
+    validate_crop_params(100, 100, 540, 260, 640, 360)
+
+
+# parse_preset(preset, original_width, original_height)
+
+
+def test_parse_preset_center_square():
+    assert parse_preset("center-square", 640, 360) == (360, 360, 140, 0)
+
+
+def test_parse_preset_1_1_matches_center_square():
+    assert parse_preset("1:1", 640, 360) == parse_preset("center-square", 640, 360)
+
+
+def test_parse_preset_16_9_on_wide_video():
+    # 1000x360 is wider than 16:9, so width is cropped and centered
+    assert parse_preset("16:9", 1000, 360) == (640, 360, 180, 0)
+
+
+def test_parse_preset_9_16_on_wide_video():
+    width, height, x, y = parse_preset("9:16", 640, 360)
+    assert (width, height) == (202, 360)
+    assert y == 0
+
+
+def test_parse_preset_is_case_insensitive():
+    assert parse_preset("CENTER-SQUARE", 640, 360) == parse_preset(
+        "center-square", 640, 360
+    )
+
+
+def test_parse_preset_rejects_unknown_preset():
+    assert_validation_error(parse_preset, "invalid", 640, 360, match="Unknown preset")
+
+
+def test_parse_preset_rejects_invalid_dimensions():
+    assert_validation_error(
+        parse_preset, "16:9", 0, 360, match="Invalid video dimensions"
+    )
+
+
+# parse_time(time_str)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("30", "30"),
+        ("-30", "-30"),
+        ("1.5", "1.5"),
+        ("00:30", "00:30"),
+        ("00:01:30", "00:01:30"),
+        ("00:01:30.5", "00:01:30.5"),
+    ],
+)
+def test_parse_time_accepts_valid_formats(value, expected):
+    assert parse_time(value) == expected
+
+
+@pytest.mark.parametrize("value", ["abc", "1:2:3:4", "10:", "1h30m"])
+def test_parse_time_rejects_invalid_formats(value):
+    assert_validation_error(parse_time, value, match="Time format should be")
+
+
+# calculate_grid_size(n, rows, cols) / build_pipeline_filter(...)
+
+
+def test_calculate_grid_size():
+    """Test the grid size calculation function."""
+    # Test with both rows and columns specified
+    assert calculate_grid_size(4, 2, 2) == (2, 2)
+
+    # Test with only rows specified
+    assert calculate_grid_size(5, 2) == (2, 3)
+
+    # Test with only columns specified
+    assert calculate_grid_size(5, None, 2) == (3, 2)
+
+    # Test with neither specified (should be as square as possible)
+    assert calculate_grid_size(4) == (2, 2)
+    assert calculate_grid_size(5) == (2, 3)
+    assert calculate_grid_size(9) == (3, 3)
+
+    # Test with invalid grid size
+    with pytest.raises(ValueError):
+        calculate_grid_size(5, 1, 2)  # 1x2 grid can't fit 5 videos
+
+
+def test_build_pipeline_filter():
+    """Test the fused crop + stack filter graph construction."""
+    assert build_pipeline_filter(2, 320, 240, 0, 0) == (
+        "[0:v]crop=320:240:0:0[c0];[1:v]crop=320:240:0:0[c1];[c0][c1]hstack=inputs=2[v]"
+    )
+
+    # Vertical stacking uses vstack
+    assert "vstack=inputs=2" in build_pipeline_filter(
+        2, 320, 240, 10, 20, vertical=True
+    )